@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Generate responsive image variants for images/.
+
+Each source image is resized to a set of standard widths and saved as
+AVIF, WebP and JPEG (PNG for images with transparency). A data file
+describing the variants is written for `srcset` use in the includes.
+Images whose content hash is unchanged since the last run are skipped,
+and the remaining ones are processed in parallel across all cores.
+
+Usage:
+    uv run python .github/scripts/images/responsive_images.py
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, features
+except ImportError:
+    print("Error: Pillow library not found!")
+    print("Install it with: uv pip install Pillow")
+    sys.exit(1)
+
+try:
+    import yaml
+except ImportError:
+    print("Error: PyYAML library not found!")
+    print("Install it with: uv pip install pyyaml")
+    sys.exit(1)
+
+SITE_ROOT = Path('.')
+IMAGES_DIR = Path('images')
+OUTPUT_DIR = Path('images/responsive')
+DATA_FILE = Path('_data/responsive_images.yml')
+MANIFEST_NAME = 'manifest.json'
+
+# Standard widths; the original width is always added as the largest variant
+WIDTHS = [160, 320, 640, 960, 1280, 1920]
+
+SOURCE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+
+# Icons must keep their exact names and sizes; theme screenshots are documentation only
+EXCLUDE = ['favicon*', 'android-chrome*', 'apple-touch-icon*', 'mstile*', 'safari-pinned-tab*',
+           'themes/*']
+
+# Output format -> (Pillow format name, save options, MIME type)
+FORMATS = {
+    'avif': ('AVIF', {'quality': 60, 'speed': 8}, 'image/avif'),
+    'webp': ('WEBP', {'quality': 80, 'method': 6}, 'image/webp'),
+    'jpg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}, 'image/jpeg'),
+    'png': ('PNG', {'optimize': True}, 'image/png'),
+}
+
+# Modern formats offered as <source> elements, best compression first
+MODERN_FORMATS = ['avif', 'webp']
+
+# Bump when output settings change, so every image is regenerated
+PIPELINE_VERSION = 1
+
+
+def file_hash(path):
+    """SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def find_sources(images_dir=IMAGES_DIR, output_dir=OUTPUT_DIR):
+    """
+    Return the raster images to process (sorted, relative to images_dir).
+
+    Generated variants are skipped, both in output_dir and in the default
+    OUTPUT_DIR (left over from runs with the default settings).
+    """
+    images_dir = Path(images_dir)
+    generated = {Path(output_dir).resolve(), OUTPUT_DIR.resolve()}
+    sources = []
+    for path in sorted(images_dir.rglob('*')):
+        if not path.is_file() or path.suffix.lower() not in SOURCE_EXTENSIONS:
+            continue
+        if generated & set(path.resolve().parents):
+            continue
+        rel = path.relative_to(images_dir)
+        if any(fnmatch.fnmatch(path.name, p) or fnmatch.fnmatch(rel.as_posix(), p) for p in EXCLUDE):
+            continue
+        sources.append(rel)
+    return sources
+
+
+def target_widths(original_width, widths=WIDTHS):
+    """Widths to generate: the standard ones smaller than the original, plus the original."""
+    return [w for w in widths if w < original_width] + [original_width]
+
+
+def available_formats(has_alpha):
+    """Output formats for an image, in order of preference (best compression first)."""
+    formats = [ext for ext in MODERN_FORMATS if features.check(ext)]
+    # Fallback format every browser supports
+    formats.append('png' if has_alpha else 'jpg')
+    return formats
+
+
+def process_image(job):
+    """
+    Generate all variants of one image (runs in a worker process).
+
+    Args:
+        job: Tuple (source path, relative name, output directory, content hash)
+
+    Returns:
+        Manifest record for the image
+    """
+    source, name, output_dir, digest = job
+    output_dir = Path(output_dir)
+    # Keep the source extension in the name so photo.jpg and photo.png cannot collide
+    stem = name.replace('/', '_').replace('.', '-')
+
+    with Image.open(source) as image:
+        image.load()
+        width, height = image.size
+        has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+
+        variants = {}
+        for w in target_widths(width):
+            h = max(1, round(height * w / width))
+            resized = image if w == width else image.resize((w, h), Image.LANCZOS)
+            for ext in available_formats(has_alpha):
+                pil_format, options, _ = FORMATS[ext]
+                out = output_dir / f'{stem}-{w}.{ext}'
+                resized.save(out, pil_format, **options)
+                variants.setdefault(ext, []).append({'width': w, 'file': out.name})
+
+    return {
+        'hash': digest,
+        'version': PIPELINE_VERSION,
+        'width': width,
+        'height': height,
+        'variants': variants,
+    }
+
+
+def variant_list(variants):
+    """File names and widths of a list of variants, for the data file."""
+    return [{'file': v['file'], 'width': v['width']} for v in variants]
+
+
+def build_data(manifest, url_prefix):
+    """
+    Build the data file content used by the includes.
+
+    Variant files are listed by name with their width; the includes join
+    them with `dir` and the site's base_path to build the srcset URLs.
+
+    Returns:
+        Dictionary keyed by image path relative to images/
+    """
+    data = {}
+    for name, record in sorted(manifest.items()):
+        fallback = 'png' if 'png' in record['variants'] else 'jpg'
+        largest = record['variants'][fallback][-1]
+        data[name] = {
+            'width': record['width'],
+            'height': record['height'],
+            'dir': url_prefix,
+            'sources': [
+                {'type': FORMATS[ext][2], 'variants': variant_list(record['variants'][ext])}
+                for ext in MODERN_FORMATS if ext in record['variants']
+            ],
+            'fallback': {
+                'file': largest['file'],
+                'variants': variant_list(record['variants'][fallback]),
+            },
+        }
+    return data
+
+
+def load_manifest(path):
+    """Load the manifest of previously generated images ({} if missing or corrupt)."""
+    try:
+        return json.loads(Path(path).read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def is_current(record, digest, output_dir):
+    """True if a manifest record matches the source hash and all its files exist."""
+    if not record or record.get('hash') != digest or record.get('version') != PIPELINE_VERSION:
+        return False
+    return all((output_dir / v['file']).exists()
+               for variants in record['variants'].values() for v in variants)
+
+
+def site_url(path, site_root=SITE_ROOT):
+    """
+    URL path under which Jekyll serves a directory of the site
+    ('' for the site root itself).
+
+    Raises:
+        ValueError: If path is outside the site root
+    """
+    rel = Path(path).resolve().relative_to(Path(site_root).resolve())
+    return '' if rel == Path('.') else '/' + rel.as_posix()
+
+
+def generate(images_dir=IMAGES_DIR, output_dir=OUTPUT_DIR, data_file=DATA_FILE, workers=None,
+             url_prefix=None):
+    """
+    Generate variants for all changed images and write the data file.
+
+    Args:
+        images_dir: Directory of source images
+        output_dir: Directory for generated variants
+        data_file: YAML data file for the includes
+        workers: Number of worker processes (default: CPU count)
+        url_prefix: URL path of output_dir on the site (default: its path
+            relative to the site root)
+
+    Returns:
+        True on success, False if the URL prefix cannot be determined
+    """
+    images_dir = Path(images_dir)
+    output_dir = Path(output_dir)
+    data_file = Path(data_file)
+    if url_prefix is None:
+        try:
+            url_prefix = site_url(output_dir)
+        except ValueError:
+            print(f"Error: {output_dir} is outside the site root; pass --url-prefix")
+            return False
+    # No trailing slash: the includes append "/" and the file name
+    url_prefix = '/' + url_prefix.strip('/') if url_prefix.strip('/') else ''
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest_file = output_dir / MANIFEST_NAME
+    manifest = load_manifest(manifest_file)
+
+    sources = find_sources(images_dir, output_dir)
+    print(f"Found {len(sources)} source images in {images_dir}")
+
+    jobs = []
+    new_manifest = {}
+    for rel in sources:
+        name = rel.as_posix()
+        digest = file_hash(images_dir / rel)
+        if is_current(manifest.get(name), digest, output_dir):
+            new_manifest[name] = manifest[name]
+        else:
+            jobs.append((str(images_dir / rel), name, str(output_dir), digest))
+
+    print(f"Unchanged: {len(new_manifest)}, to process: {len(jobs)}")
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            for job, record in zip(jobs, pool.map(process_image, jobs)):
+                new_manifest[job[1]] = record
+                count = sum(len(v) for v in record['variants'].values())
+                print(f"  ✓ {job[1]} ({count} variants)")
+
+    # Remove variants of deleted or regenerated images that are no longer referenced
+    keep = {MANIFEST_NAME} | {v['file'] for record in new_manifest.values()
+                              for variants in record['variants'].values() for v in variants}
+    removed = 0
+    for path in output_dir.iterdir():
+        if path.is_file() and path.name not in keep:
+            path.unlink()
+            removed += 1
+
+    manifest_file.write_text(json.dumps(new_manifest, indent=1, sort_keys=True), encoding='utf-8')
+
+    data = build_data(new_manifest, url_prefix)
+    text = yaml.safe_dump(data, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    if not data_file.exists() or data_file.read_text(encoding='utf-8') != text:
+        data_file.parent.mkdir(exist_ok=True)
+        data_file.write_text(text, encoding='utf-8')
+        print(f"✓ Wrote {data_file}")
+    else:
+        print(f"✓ {data_file} already up to date")
+
+    if removed:
+        print(f"Removed {removed} stale variants")
+    return True
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Generate responsive image variants.")
+    parser.add_argument('--images-dir', default=IMAGES_DIR, help="source images (default: %(default)s)")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help="generated variants (default: %(default)s)")
+    parser.add_argument('--data-file', default=DATA_FILE, help="srcset data file (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--url-prefix', default=None,
+                        help="URL path of the output directory on the site (default: derived from --output-dir)")
+    args = parser.parse_args()
+
+    ok = generate(args.images_dir, args.output_dir, args.data_file, args.workers, args.url_prefix)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Tests for the paths and URLs of responsive_images.py.
+
+Run with:
+    uv run python -m pytest .github/scripts/images
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import responsive_images  # noqa: E402
+
+
+@pytest.mark.parametrize('output_dir', ['images/responsive', './images/responsive', 'images/responsive/'])
+def test_site_url_of_relative_paths(tmp_path, monkeypatch, output_dir):
+    monkeypatch.chdir(tmp_path)
+    assert responsive_images.site_url(output_dir) == '/images/responsive'
+
+
+def test_site_url_of_absolute_paths(tmp_path):
+    assert responsive_images.site_url(tmp_path / 'assets' / 'img', site_root=tmp_path) == '/assets/img'
+    assert responsive_images.site_url(tmp_path, site_root=tmp_path) == ''
+    with pytest.raises(ValueError):
+        responsive_images.site_url(tmp_path.parent, site_root=tmp_path)
+
+
+def test_generated_variants_are_not_sources(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for name in ('photo.jpg', 'favicon.png', 'responsive/photo-jpg-160.jpg', 'other/photo-jpg-160.jpg',
+                 'talks/map.png'):
+        path = tmp_path / 'images' / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b'')
+
+    # The default output directory is skipped even when writing elsewhere
+    sources = responsive_images.find_sources('images', 'images/other')
+    assert [p.as_posix() for p in sources] == ['photo.jpg', 'talks/map.png']
@@ -1,77 +1,83 @@
 #!/usr/bin/env python3
 """
 Search arXiv for publications and add url_paper fields to BibTeX.
-Uses the arxiv Python library to search by title.
+Searches by title through the async arXiv client, several entries at a time.
 """
 
 import bibtexparser
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.customization import convert_to_unicode
 from pathlib import Path
-import time
-import re
-import sys
+import argparse
+import asyncio
 
-try:
-    import arxiv
-except ImportError:
-    print("Error: arxiv library not found!")
-    print("Install it with: uv pip install arxiv")
-    sys.exit(1)
+from arxiv_client import ArxivClient
+from bibtex_utils import format_bibtex_entry, normalize_title
+from checkpoint import Journal, atomic_write_text
 
 
-def normalize_title(title):
-    """Normalize title for comparison."""
-    # Remove special characters, convert to lowercase
-    title = title.lower()
-    title = re.sub(r'[^a-z0-9\s]', '', title)
-    title = ' '.join(title.split())  # Normalize whitespace
-    return title
-
-
-def search_arxiv_for_paper(title, authors=None, max_results=5):
+async def find_arxiv_url(client, title, max_results=5):
     """
-    Search arXiv for a paper by title.
+    Search arXiv for a paper by title, raising on network or API errors.
 
     Args:
+        client: Open ArxivClient
         title: Paper title
-        authors: Optional author names for better matching
         max_results: Maximum number of results to check
 
     Returns:
         arXiv URL if found, None otherwise
     """
-    try:
-        # Create search query
-        query = f'ti:"{title}"'
+    # Create search query
+    query = f'ti:"{title}"'
+
+    normalized_title = normalize_title(title)
+
+    # Results are checked as they stream in; stop at the first match
+    async for result in client.iter_query(query, max_results=max_results):
+        result_title = normalize_title(result['title'])
+
+        # Check if titles match (allowing for minor differences)
+        if normalized_title in result_title or result_title in normalized_title:
+            # Calculate similarity
+            words_query = set(normalized_title.split())
+            words_result = set(result_title.split())
 
-        # Search arXiv
-        search = arxiv.Search(
-            query=query,
-            max_results=max_results,
-            sort_by=arxiv.SortCriterion.Relevance
-        )
+            # If at least 70% of words match, consider it a match
+            if len(words_query & words_result) / len(words_query | words_result) > 0.7:
+                return result['entry_id']  # This is the arXiv URL
 
-        normalized_title = normalize_title(title)
+    return None
 
-        for result in search.results():
-            result_title = normalize_title(result.title)
 
-            # Check if titles match (allowing for minor differences)
-            if normalized_title in result_title or result_title in normalized_title:
-                # Calculate similarity
-                words_query = set(normalized_title.split())
-                words_result = set(result_title.split())
+async def search_entries(pending, on_result, concurrency=4, base_url=None, rate_limit=None):
+    """
+    Search arXiv for several entries concurrently.
 
-                # If at least 70% of words match, consider it a match
-                if len(words_query & words_result) / len(words_query | words_result) > 0.7:
-                    return result.entry_id  # This is the arXiv URL
+    Args:
+        pending: List of (index, entry) pairs to search
+        on_result: Callback on_result(index, entry, arxiv_url, error), called
+            as each search completes (error is None on success)
+        concurrency: Maximum number of requests in flight
+        base_url: Optional API endpoint override (e.g. a local test server)
+        rate_limit: Optional minimum seconds between requests (default: arXiv's limit)
+    """
+    client_kwargs = {'concurrency': concurrency}
+    if base_url:
+        client_kwargs['base_url'] = base_url
+    if rate_limit is not None:
+        client_kwargs['rate_limit'] = rate_limit
 
-        return None
+    async with ArxivClient(**client_kwargs) as client:
+        async def search_one(index, entry):
+            try:
+                arxiv_url = await find_arxiv_url(client, entry.get('title', ''))
+            except Exception as e:
+                on_result(index, entry, None, e)
+            else:
+                on_result(index, entry, arxiv_url, None)
 
-    except Exception as e:
-        print(f"      Error searching arXiv: {e}")
-        return None
+        await asyncio.gather(*(search_one(i, entry) for i, entry in pending))
 
 
 def has_paper_url(entry):
@@ -79,16 +85,33 @@ def has_paper_url(entry):
     return bool(entry.get('url_paper'))
 
 
-def update_bibtex_with_arxiv(input_file, output_file=None):
+def journal_path_for(output_file):
+    """Path of the checkpoint journal kept next to the output file."""
+    output_file = Path(output_file)
+    return output_file.with_name(output_file.name + '.journal')
+
+
+def update_bibtex_with_arxiv(input_file, output_file=None, concurrency=4, base_url=None,
+                             resume=False, rate_limit=None):
     """
     Read BibTeX file, search arXiv for each entry, and add url_paper fields.
 
+    Every search result is appended to a journal next to the output file as
+    soon as it arrives. With resume=True, results already in the journal are
+    replayed and only the remaining entries are searched.
+
     Args:
         input_file: Path to input BibTeX file
         output_file: Path to output file (if None, overwrites input)
+        concurrency: Maximum number of arXiv requests in flight
+        base_url: Optional arXiv API endpoint override
+        resume: Continue from the journal of an interrupted run
+        rate_limit: Optional minimum seconds between requests (only lower it
+            for a local server, e.g. a netreplay session)
     """
     if output_file is None:
         output_file = input_file
+    journal_file = journal_path_for(output_file)
 
     print("=" * 80)
     print("arXiv URL Finder for BibTeX")
@@ -110,28 +133,55 @@ def update_bibtex_with_arxiv(input_file, output_file=None):
         'already_has_url': 0,
         'found_on_arxiv': 0,
         'not_found': 0,
-        'errors': 0
+        'errors': 0,
+        'resumed': 0
     }
 
-    updated_entries = []
+    # Results of an interrupted run, keyed by citation key
+    journaled = {}
+    if resume:
+        for record in Journal.replay(journal_file):
+            journaled[record['key']] = record.get('url_paper')
+        print(f"Resuming: {len(journaled)} results replayed from {journal_file}")
+    elif journal_file.exists():
+        print(f"Discarding stale journal {journal_file} (use --resume to continue it)")
+        journal_file.unlink()
 
-    for i, entry in enumerate(bib_database.entries, 1):
-        title = entry.get('title', 'Unknown')
-        authors = entry.get('author', '')
-        year = entry.get('year', '')
-
-        print(f"[{i}/{total}] {title[:60]}...")
+    updated_entries = list(bib_database.entries)
+    pending = []
 
+    for i, entry in enumerate(updated_entries, 1):
         # Check if already has url_paper field
         if has_paper_url(entry):
-            print(f"      ✓ Already has url_paper field")
             stats['already_has_url'] += 1
-            updated_entries.append(entry)
             continue
 
-        # Search arXiv
-        print(f"      Searching arXiv...")
-        arxiv_url = search_arxiv_for_paper(title, authors)
+        key = entry.get('ID', '')
+        if key in journaled:
+            if journaled[key]:
+                entry['url_paper'] = journaled[key]
+                stats['found_on_arxiv'] += 1
+            else:
+                stats['not_found'] += 1
+            stats['resumed'] += 1
+            continue
+
+        pending.append((i, entry))
+
+    print(f"Already have url_paper: {stats['already_has_url']}")
+    print(f"Searching arXiv for {len(pending)} entries ({concurrency} at a time)...\n")
+
+    def on_result(i, entry, arxiv_url, error):
+        title = entry.get('title', 'Unknown')
+        print(f"[{i}/{total}] {title[:60]}...")
+
+        if error is not None:
+            # Not journaled, so a resumed run retries it
+            print(f"      Error searching arXiv: {error}")
+            stats['errors'] += 1
+            return
+
+        journal.append({'index': i, 'key': entry.get('ID', ''), 'url_paper': arxiv_url})
 
         if arxiv_url:
             print(f"      ✓ Found: {arxiv_url}")
@@ -142,11 +192,16 @@ def update_bibtex_with_arxiv(input_file, output_file=None):
             print(f"      ✗ Not found on arXiv")
             stats['not_found'] += 1
 
-        updated_entries.append(entry)
-
-        # Rate limiting: be nice to arXiv servers
-        if i < total:
-            time.sleep(1)  # 1 second delay between requests
+    # Rate limiting is handled by the client: be nice to arXiv servers
+    with Journal(journal_file) as journal:
+        try:
+            asyncio.run(search_entries(pending, on_result, concurrency=concurrency,
+                                       base_url=base_url, rate_limit=rate_limit))
+        except KeyboardInterrupt:
+            journal.close()
+            print(f"\nInterrupted. Progress saved to {journal_file}")
+            print("Re-run with --resume to continue.")
+            return
 
     # Update database with modified entries
     bib_database.entries = updated_entries
@@ -155,17 +210,27 @@ def update_bibtex_with_arxiv(input_file, output_file=None):
     print(f"\n{'=' * 80}")
     print("Writing updated BibTeX file...")
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        # Write header
-        f.write("% Carlo Ciliberto - Publications\n")
-        f.write("% BibTeX file with arXiv URLs added\n")
-        f.write(f"% Total entries: {len(updated_entries)}\n")
-        f.write("% arXiv URLs added automatically\n\n")
+    # Write header
+    parts = [
+        "% Carlo Ciliberto - Publications\n",
+        "% BibTeX file with arXiv URLs added\n",
+        f"% Total entries: {len(updated_entries)}\n",
+        "% arXiv URLs added automatically\n\n",
+    ]
+
+    # Write each entry
+    for entry in updated_entries:
+        parts.append(format_bibtex_entry(entry))
+        parts.append("\n\n")
+
+    # Temp file + rename: an interruption here leaves the old output intact
+    atomic_write_text(output_file, ''.join(parts))
 
-        # Write each entry
-        for entry in updated_entries:
-            f.write(format_bibtex_entry(entry))
-            f.write("\n\n")
+    # The output now holds every result; keep the journal only if some failed
+    if stats['errors'] == 0:
+        Journal(journal_file).remove()
+    else:
+        print(f"⚠️  {stats['errors']} searches failed; re-run with --resume to retry them")
 
     # Print statistics
     print(f"✓ Updated BibTeX file written to: {output_file}")
@@ -177,6 +242,9 @@ def update_bibtex_with_arxiv(input_file, output_file=None):
     print(f"Already had URL:         {stats['already_has_url']}")
     print(f"Found on arXiv:          {stats['found_on_arxiv']}")
     print(f"Not found on arXiv:      {stats['not_found']}")
+    print(f"Errors:                  {stats['errors']}")
+    if resume:
+        print(f"Replayed from journal:   {stats['resumed']}")
     print()
     print("Next steps:")
     print("1. Review the updated file")
@@ -185,46 +253,15 @@ def update_bibtex_with_arxiv(input_file, output_file=None):
     print()
 
 
-def format_bibtex_entry(entry):
-    """Format a BibTeX entry for writing, preserving ALL original fields."""
-    entry_type = entry.get('ENTRYTYPE', 'misc')
-    entry_id = entry.get('ID', 'unknown')
-
-    lines = [f"@{entry_type}{{{entry_id},"]
-
-    # Preferred order of fields for readability
-    field_order = [
-        'title', 'author', 'booktitle', 'journal', 'howpublished', 'publisher',
-        'pages', 'volume', 'number', 'year', 'month', 'organization',
-        'url_paper', 'url', 'pdf', 'doi', 'eprint', 'archivePrefix', 'primaryClass',
-        'url_code', 'local_code', 'code',
-        'url_slides', 'local_slides', 'slides',
-        'url_video', 'local_video', 'video',
-        'abstract', 'note'
-    ]
-
-    # Track which fields we've added
-    added_fields = set()
-
-    # Add fields in preferred order
-    for field in field_order:
-        if field in entry and field not in ['ENTRYTYPE', 'ID']:
-            value = entry[field]
-            lines.append(f"  {field} = {{{value}}},")
-            added_fields.add(field)
-
-    # Add any remaining fields not in the standard order (to preserve everything)
-    for field, value in sorted(entry.items()):
-        if field not in added_fields and field not in ['ENTRYTYPE', 'ID']:
-            lines.append(f"  {field} = {{{value}}},")
-
-    lines.append("}")
-
-    return "\n".join(lines)
-
-
 def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description="Add arXiv url_paper fields to BibTeX entries.")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue an interrupted run from its journal")
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help="do not ask for confirmation")
+    args = parser.parse_args()
+
     input_file = Path('.github/data/publications.bib')
     output_file = Path('.github/data/publications_with_arxiv.bib')
 
@@ -238,17 +275,18 @@ def main():
     print(f"Input:  {input_file}")
     print(f"Output: {output_file}")
     print()
-    print("Note: This will take several minutes due to rate limiting (1 req/sec)")
+    print("Note: This will take several minutes due to rate limiting (1 req / 3 sec)")
     print("      to be respectful to arXiv servers.")
     print()
 
-    response = input("Continue? [y/N] ")
-    if response.lower() != 'y':
-        print("Aborted.")
-        return
+    if not args.yes:
+        response = input("Continue? [y/N] ")
+        if response.lower() != 'y':
+            print("Aborted.")
+            return
 
     print()
-    update_bibtex_with_arxiv(input_file, output_file)
+    update_bibtex_with_arxiv(input_file, output_file, resume=args.resume)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Asynchronous client for the arXiv API.
+Keeps a pool of keep-alive connections, respects the global arXiv rate limit
+and parses the Atom feed incrementally while the response streams in.
+"""
+
+import asyncio
+import sys
+import xml.etree.ElementTree as ET
+
+try:
+    import aiohttp
+except ImportError:
+    print("Error: aiohttp library not found!")
+    print("Install it with: uv pip install aiohttp")
+    sys.exit(1)
+
+
+# Public arXiv API endpoint (override with base_url to use a local fake server)
+ARXIV_API_URL = 'https://export.arxiv.org/api/query'
+
+# arXiv asks clients to make no more than one request every 3 seconds
+ARXIV_RATE_LIMIT = 3.0
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+OPENSEARCH = '{http://a9.com/-/spec/opensearch/1.1/}'
+ARXIV = '{http://arxiv.org/schemas/atom}'
+
+
+class ArxivError(Exception):
+    """Raised when the arXiv API returns an error."""
+
+
+class RateLimiter:
+    """
+    Space out request start times by a fixed interval.
+
+    Shared by all requests of a client, so the limit holds globally no matter
+    how many requests are in flight.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def wait(self):
+        """Block until the next request is allowed to start."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            delay = self._next_slot - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot = max(now, self._next_slot) + self.interval
+
+
+def _text(elem, tag):
+    """Return whitespace-normalized text of a child element ('' if missing)."""
+    child = elem.find(tag)
+    if child is None or child.text is None:
+        return ''
+    return ' '.join(child.text.split())
+
+
+def parse_entry(elem):
+    """
+    Convert an Atom <entry> element to a dictionary.
+
+    Returns:
+        Dictionary with entry_id, title, authors, summary, published,
+        updated, doi and primary_category
+    """
+    primary = elem.find(f'{ARXIV}primary_category')
+    return {
+        'entry_id': _text(elem, f'{ATOM}id'),
+        'title': _text(elem, f'{ATOM}title'),
+        'authors': [_text(a, f'{ATOM}name') for a in elem.findall(f'{ATOM}author')],
+        'summary': _text(elem, f'{ATOM}summary'),
+        'published': _text(elem, f'{ATOM}published'),
+        'updated': _text(elem, f'{ATOM}updated'),
+        'doi': _text(elem, f'{ARXIV}doi'),
+        'primary_category': primary.get('term', '') if primary is not None else '',
+    }
+
+
+class FeedParser:
+    """
+    Incremental Atom feed parser.
+
+    Feed it raw bytes as they arrive; completed entries are returned
+    immediately and their elements discarded to keep memory flat.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=('end',))
+        self.total_results = None
+
+    def feed(self, data):
+        """Feed a chunk of bytes and return the entries completed by it."""
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self):
+        """
+        Signal end of stream and return any remaining entries.
+
+        Raises:
+            ArxivError: If the stream ended in the middle of the feed
+        """
+        try:
+            self._parser.close()
+        except ET.ParseError as e:
+            raise ArxivError(f"incomplete feed: {e}") from e
+        return self._drain()
+
+    def _drain(self):
+        entries = []
+        for _, elem in self._parser.read_events():
+            if elem.tag == f'{ATOM}entry':
+                entry = parse_entry(elem)
+                if '/api/errors' in entry['entry_id']:
+                    raise ArxivError(entry['summary'] or entry['title'])
+                entries.append(entry)
+                elem.clear()
+            elif elem.tag == f'{OPENSEARCH}totalResults' and elem.text:
+                self.total_results = int(elem.text)
+        return entries
+
+
+class ArxivClient:
+    """
+    Async arXiv API client with pooled HTTP connections.
+
+    Use as an async context manager:
+
+        async with ArxivClient() as client:
+            results = await client.search('ti:"kernel methods"')
+    """
+
+    def __init__(self, base_url=ARXIV_API_URL, concurrency=4,
+                 rate_limit=ARXIV_RATE_LIMIT, timeout=30, retries=3,
+                 chunk_size=16384):
+        """
+        Args:
+            base_url: API endpoint (point this at a local server for tests)
+            concurrency: Maximum number of requests in flight (pool size)
+            rate_limit: Minimum seconds between request starts
+            timeout: Total timeout per request in seconds
+            retries: Number of retries on network or server errors
+            chunk_size: Size of chunks fed to the Atom parser
+        """
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.chunk_size = chunk_size
+        self._limiter = RateLimiter(rate_limit)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=60)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+        self._session = None
+
+    async def iter_query(self, search_query, start=0, max_results=10,
+                         sort_by='relevance', sort_order='descending', info=None):
+        """
+        Run a single API query and yield entries as they are parsed.
+
+        Args:
+            search_query: arXiv query string (e.g. 'ti:"Some Title"')
+            start: Offset of the first result
+            max_results: Number of results to request
+            sort_by: 'relevance', 'lastUpdatedDate' or 'submittedDate'
+            sort_order: 'ascending' or 'descending'
+            info: Optional dictionary that receives the feed's 'total_results'
+
+        Yields:
+            Entry dictionaries (see parse_entry)
+        """
+        params = {
+            'search_query': search_query,
+            'start': str(start),
+            'max_results': str(max_results),
+            'sortBy': sort_by,
+            'sortOrder': sort_order,
+        }
+
+        for attempt in range(self.retries + 1):
+            yielded = 0
+            try:
+                async with self._semaphore:
+                    await self._limiter.wait()
+                    async with self._session.get(self.base_url, params=params) as response:
+                        if response.status >= 500 or response.status == 429:
+                            raise aiohttp.ClientResponseError(
+                                response.request_info, response.history,
+                                status=response.status, message=response.reason or '',
+                            )
+                        response.raise_for_status()
+
+                        parser = FeedParser()
+                        async for chunk in response.content.iter_chunked(self.chunk_size):
+                            for entry in parser.feed(chunk):
+                                yielded += 1
+                                yield entry
+                        for entry in parser.close():
+                            yielded += 1
+                            yield entry
+                        if info is not None:
+                            info['total_results'] = parser.total_results
+                        return
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Retrying after entries were handed out would duplicate them
+                if yielded or attempt == self.retries:
+                    raise
+                if isinstance(e, aiohttp.ClientResponseError) and e.status < 500 and e.status != 429:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+
+    async def search(self, search_query, max_results=10, sort_by='relevance',
+                     sort_order='descending'):
+        """
+        Run a single API query and collect all entries.
+
+        Returns:
+            List of entry dictionaries
+        """
+        return [entry async for entry in self.iter_query(
+            search_query, max_results=max_results,
+            sort_by=sort_by, sort_order=sort_order,
+        )]
+
+    async def iter_all(self, search_query, max_results=500, page_size=100,
+                       sort_by='submittedDate', sort_order='descending'):
+        """
+        Yield up to max_results entries, fetching pages one after the other.
+
+        Paging stops once the number of results reported by the feed
+        (opensearch:totalResults) has been fetched. arXiv sometimes returns
+        short or empty pages in the middle of a result set; the next page
+        then starts where the short one ended, and empty pages are retried
+        with backoff up to `retries` times.
+        """
+        fetched = 0
+        total = None
+        empty_pages = 0
+        while True:
+            limit = max_results if total is None else min(max_results, total)
+            if fetched >= limit:
+                break
+            page_limit = min(page_size, limit - fetched)
+            page_count = 0
+            info = {}
+            async for entry in self.iter_query(
+                search_query, start=fetched, max_results=page_limit,
+                sort_by=sort_by, sort_order=sort_order, info=info,
+            ):
+                page_count += 1
+                yield entry
+            fetched += page_count
+
+            # An empty page may be a glitch reporting no results at all
+            if info.get('total_results') is not None and (page_count or total is None):
+                total = info['total_results']
+            if total is None and page_count < page_limit:
+                # No totalResults in the feed: a short page is the last one
+                break
+            if page_count:
+                empty_pages = 0
+            elif fetched < min(max_results, total):
+                if empty_pages == self.retries:
+                    break
+                await asyncio.sleep(2 ** empty_pages)
+                empty_pages += 1
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Interned registry of publication authors.
+Each distinct author is parsed and formatted once; every later occurrence
+(under any alias) returns the same canonical record.
+"""
+
+import re
+
+
+def split_author_name(author):
+    """
+    Split an author name into last name and list of initials.
+    Examples:
+        "Carlo Ciliberto" -> ("Ciliberto", ["C."])
+        "Ciliberto, Carlo" -> ("Ciliberto", ["C."])
+        "C. Ciliberto" -> ("Ciliberto", ["C."])
+    """
+    author = author.strip()
+
+    # Handle "Last, First Middle" format (common in BibTeX)
+    if ',' in author:
+        parts = author.split(',', 1)
+        last_name = parts[0].strip()
+        first_names = parts[1].strip()
+    else:
+        # Handle "First Middle Last" format
+        parts = author.split()
+        if len(parts) == 0:
+            return author, []
+        last_name = parts[-1]
+        first_names = ' '.join(parts[:-1])
+
+    # Get first letter of each first name
+    initials = [name[0].upper() + '.' for name in first_names.split() if name]
+    return last_name, initials
+
+
+def format_author_name(author):
+    """
+    Format a single author name to: Surname, I.
+    Examples:
+        "Carlo Ciliberto" -> "C. Ciliberto"
+        "Ciliberto, Carlo" -> "C. Ciliberto"
+        "John Smith" -> "J. Smith"
+    """
+    last_name, initials = split_author_name(author)
+
+    # Format: I. Last or I. M. Last
+    if initials:
+        return ' '.join(initials) + ' ' + last_name
+    else:
+        return last_name
+
+
+def display_name(author):
+    """Return an author name in "First Last" order ("Ciliberto, Carlo" -> "Carlo Ciliberto")."""
+    author = author.strip()
+    if ',' in author:
+        last_name, first_names = author.split(',', 1)
+        return f"{first_names.strip()} {last_name.strip()}".strip()
+    return author
+
+
+def author_id(citation):
+    """Build a URL-safe identifier from a formatted name ("C. Ciliberto" -> "c-ciliberto")."""
+    return re.sub(r'[^a-z0-9]+', '-', citation.lower()).strip('-')
+
+
+class AuthorRegistry:
+    """
+    Canonical author records keyed by formatted citation name.
+
+    Records are plain dictionaries:
+        id: URL-safe identifier (e.g. "c-ciliberto")
+        name: Longest spelling seen (e.g. "Carlo Ciliberto")
+        surname: Last name
+        initials: Initials string (e.g. "C.")
+        citation: Formatted form used in citations (e.g. "C. Ciliberto")
+        aliases: Every raw spelling seen
+        publications: Citation keys of the entries the author appears in
+    """
+
+    def __init__(self):
+        self._by_raw = {}
+        self._by_citation = {}
+        self._list_cache = {}
+
+    def __len__(self):
+        return len(self._by_citation)
+
+    def intern(self, author):
+        """
+        Return the canonical record for an author name, creating it on first use.
+
+        Raw spellings are memoized, so each distinct string is parsed only once.
+        """
+        raw = author.strip()
+        record = self._by_raw.get(raw)
+        if record is not None:
+            return record
+
+        last_name, initials = split_author_name(raw)
+        citation = format_author_name(raw)
+
+        record = self._by_citation.get(citation)
+        if record is None:
+            record = {
+                'id': author_id(citation),
+                'name': display_name(raw),
+                'surname': last_name,
+                'initials': ' '.join(initials),
+                'citation': citation,
+                'aliases': [],
+                'publications': [],
+            }
+            self._by_citation[citation] = record
+
+        if raw and raw not in record['aliases']:
+            record['aliases'].append(raw)
+            # Prefer the most complete spelling ("Carlo Ciliberto" over "C. Ciliberto")
+            display = display_name(raw)
+            if len(display) > len(record['name']):
+                record['name'] = display
+
+        self._by_raw[raw] = record
+        return record
+
+    def parse_author_list(self, authors):
+        """
+        Split a BibTeX author field on " and " and intern every author.
+
+        Returns:
+            Tuple of canonical records, in author order
+        """
+        if not authors:
+            return ()
+
+        records = self._list_cache.get(authors)
+        if records is None:
+            records = tuple(self.intern(a) for a in authors.split(' and ') if a.strip())
+            self._list_cache[authors] = records
+        return records
+
+    def add_publication(self, key, records):
+        """Record that the given authors appear in the entry with citation key `key`."""
+        for record in records:
+            if key and key not in record['publications']:
+                record['publications'].append(key)
+
+    def export(self):
+        """
+        Return all records as a list sorted by surname, ready for YAML/JSON dumping.
+
+        Records are copied so callers can serialize without touching the registry.
+        """
+        records = sorted(self._by_citation.values(),
+                         key=lambda r: (r['surname'].lower(), r['initials']))
+        return [dict(r, aliases=list(r['aliases']), publications=list(r['publications']))
+                for r in records]
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for pubtools.
+
+Runs each subcommand's module imports in a fresh interpreter, reports the
+best wall time over several runs, and fails if `to-data` exceeds its budget
+or pulls in modules it should not need.
+
+Usage:
+    uv run python .github/scripts/publications/bench_startup.py [--runs 10] [--budget-ms 250]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Module each subcommand imports lazily
+SUBCOMMAND_MODULES = {
+    'help': None,
+    'to-data': 'bibtex_to_data',
+    'watch': 'watch_bibtex',
+    'arxiv-match': 'match_arxiv_by_author',
+    'arxiv-search': 'add_arxiv_urls',
+    'enrich': 'enrich_metadata',
+    'check-links': 'check_links',
+    'scholar-fetch': 'google_scholar_to_bibtex',
+    'index-pdfs': 'pdf_index',
+    'net-record': 'netreplay',
+    'net-replay': 'netreplay',
+}
+
+# Modules that must never be imported by to-data
+FORBIDDEN_FOR_TO_DATA = ['scholarly', 'aiohttp', 'arxiv_client', 'asyncio']
+
+
+def startup_code(module):
+    """Python snippet that mimics pubtools startup for a subcommand."""
+    code = "import pubtools; pubtools.build_parser()"
+    if module:
+        code += f"; import {module}"
+    return code
+
+
+def time_startup(module, runs):
+    """
+    Time interpreter start + imports for a subcommand.
+
+    Returns:
+        Best wall time in milliseconds, or None if the imports fail
+    """
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-c', startup_code(module)],
+            cwd=SCRIPT_DIR, capture_output=True,
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            return None
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def loaded_modules(module):
+    """Return the set of top-level modules loaded after importing `module`."""
+    code = startup_code(module) + "; import sys; print('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=SCRIPT_DIR, capture_output=True, text=True,
+    )
+    return {name.split('.')[0] for name in result.stdout.split()}
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark pubtools cold start.")
+    parser.add_argument('--runs', type=int, default=10, help="runs per subcommand (default: %(default)s)")
+    parser.add_argument('--budget-ms', type=float, default=250.0,
+                        help="maximum cold start for to-data (default: %(default)s)")
+    args = parser.parse_args()
+
+    baseline = time_startup(None, args.runs)
+    print(f"{'subcommand':<16}{'best (ms)':>12}")
+    print("-" * 28)
+
+    results = {}
+    for name, module in SUBCOMMAND_MODULES.items():
+        elapsed = baseline if module is None else time_startup(module, args.runs)
+        results[name] = elapsed
+        shown = f"{elapsed:.1f}" if elapsed is not None else "unavailable"
+        print(f"{name:<16}{shown:>12}")
+
+    failed = False
+
+    to_data = results['to-data']
+    if to_data is None:
+        print("\n✗ to-data failed to import")
+        failed = True
+    elif to_data > args.budget_ms:
+        print(f"\n✗ to-data cold start {to_data:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+        failed = True
+    else:
+        print(f"\n✓ to-data cold start within budget ({to_data:.1f} / {args.budget_ms:.0f} ms)")
+
+    leaked = loaded_modules('bibtex_to_data') & set(FORBIDDEN_FOR_TO_DATA)
+    if leaked:
+        print(f"✗ to-data imports unneeded modules: {', '.join(sorted(leaked))}")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
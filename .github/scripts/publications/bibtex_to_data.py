@@ -8,54 +8,22 @@ import bibtexparser
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.customization import convert_to_unicode
 from pathlib import Path
+import json
 import yaml
 
-def format_author_name(author):
-    """
-    Format a single author name to: Surname, I.
-    Examples:
-        "Carlo Ciliberto" -> "C. Ciliberto"
-        "Ciliberto, Carlo" -> "C. Ciliberto"
-        "John Smith" -> "J. Smith"
-    """
-    author = author.strip()
-
-    # Handle "Last, First Middle" format (common in BibTeX)
-    if ',' in author:
-        parts = author.split(',', 1)
-        last_name = parts[0].strip()
-        first_names = parts[1].strip()
-    else:
-        # Handle "First Middle Last" format
-        parts = author.split()
-        if len(parts) == 0:
-            return author
-        last_name = parts[-1]
-        first_names = ' '.join(parts[:-1])
-
-    # Extract initials from first names
-    if not first_names:
-        return last_name
-
-    # Get first letter of each first name
-    initials = []
-    for name in first_names.split():
-        if name:  # Skip empty strings
-            initials.append(name[0].upper() + '.')
-
-    # Format: I. Last or I. M. Last
-    if initials:
-        return ' '.join(initials) + ' ' + last_name
-    else:
-        return last_name
+from author_registry import AuthorRegistry
+from checkpoint import atomic_write_text
 
-def format_author_list(authors):
-    """Format author list for citation with initials."""
-    if not authors:
-        return ""
+# Use the libyaml emitter when available (much faster, same output for plain data)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 
-    author_list = [format_author_name(a.strip()) for a in authors.split(' and ')]
+# Fields kept out of _data/publications.yml and written to per-entry JSON files
+DETAIL_FIELDS = ['abstract']
 
+def join_author_names(author_list):
+    """Join formatted names: "A", "A and B" or "A, B, and C"."""
+    if not author_list:
+        return ""
     if len(author_list) == 1:
         return author_list[0]
     elif len(author_list) == 2:
@@ -111,9 +79,16 @@ def get_material_url(entry, material_type):
 
     return ''
 
-def bibtex_to_dict(entry):
-    """Convert BibTeX entry to dictionary for Jekyll."""
-    authors = format_author_list(entry.get('author', ''))
+def bibtex_to_dict(entry, registry):
+    """
+    Convert BibTeX entry to dictionary for Jekyll.
+
+    The entry's authors are resolved through and recorded in registry.
+    """
+    key = entry.get('ID', '')
+    author_records = registry.parse_author_list(entry.get('author', ''))
+    registry.add_publication(key, author_records)
+    authors = join_author_names([record['citation'] for record in author_records])
     title = entry.get('title', '')
     year = entry.get('year', '')
     venue = get_venue_from_entry(entry)
@@ -127,9 +102,10 @@ def bibtex_to_dict(entry):
     citation += '.'
 
     return {
-        'key': entry.get('ID', ''),
+        'key': key,
         'title': title,
         'authors': authors,
+        'author_ids': [record['id'] for record in author_records],
         'year': year,
         'venue': venue,
         'citation': citation,
@@ -137,48 +113,145 @@ def bibtex_to_dict(entry):
         'code': get_material_url(entry, 'code'),
         'slides': get_material_url(entry, 'slides'),
         'video': get_material_url(entry, 'video'),
-        'abstract': entry.get('abstract', ''),
+        # Bulky fields live in per-entry JSON files, fetched by the page on demand
+        'details': [field for field in DETAIL_FIELDS if entry.get(field)],
     }
 
-def main():
-    bibtex_file = Path('.github/data/publications.bib')
-    output_file = Path('_data/publications.yml')
+def extract_details(entry):
+    """Return the bulky fields of an entry that go to its detail file."""
+    return {field: entry[field] for field in DETAIL_FIELDS if entry.get(field)}
+
+def write_details(entries, details_dir):
+    """
+    Write one JSON file per entry with bulky fields (e.g. abstract).
+
+    Files are only rewritten when their content changes, and files of
+    entries that no longer have details are removed.
+
+    Returns:
+        Tuple (number of files written, number of files removed)
+    """
+    details_dir = Path(details_dir)
+    details_dir.mkdir(parents=True, exist_ok=True)
+
+    written = 0
+    current = set()
+    for entry in entries:
+        details = extract_details(entry)
+        key = entry.get('ID', '')
+        if not details or not key:
+            continue
+        filename = f'{key}.json'
+        current.add(filename)
+        text = json.dumps(dict(key=key, **details), ensure_ascii=False, indent=1) + '\n'
+        if write_if_changed(details_dir / filename, text):
+            written += 1
+
+    removed = 0
+    for path in details_dir.glob('*.json'):
+        if path.name not in current:
+            path.unlink()
+            removed += 1
+
+    return written, removed
+
+# Default locations, relative to the repository root
+BIBTEX_FILE = Path('.github/data/publications.bib')
+OUTPUT_FILE = Path('_data/publications.yml')
+AUTHORS_FILE = Path('_data/publication_authors.yml')
+DETAILS_DIR = Path('assets/publications')
+
+def parse_bibtex_string(text):
+    """Parse BibTeX source text and return the list of entry dictionaries."""
+    parser = BibTexParser(common_strings=True)
+    parser.customization = convert_to_unicode
+    return bibtexparser.loads(text, parser=parser).entries
+
+def build_publications(entries, registry):
+    """Convert BibTeX entries to publication dictionaries, sorted by year (descending)."""
+    publications = [bibtex_to_dict(entry, registry) for entry in entries]
+    publications.sort(key=lambda x: x.get('year', '0000'), reverse=True)
+    return publications
+
+def dump_yaml(data):
+    """Serialize data to the YAML text written to the data files."""
+    return yaml.dump(data, allow_unicode=True, default_flow_style=False, sort_keys=False,
+                     Dumper=YAML_DUMPER)
+
+def write_if_changed(path, text):
+    """
+    Atomically replace path with text, unless it already has exactly that content.
+
+    Skipping no-op writes keeps Jekyll from rebuilding the site for nothing.
+
+    Returns:
+        True if the file was written
+    """
+    path = Path(path)
+    if path.exists() and path.read_text(encoding='utf-8') == text:
+        return False
+    path.parent.mkdir(exist_ok=True)
+    atomic_write_text(path, text)
+    return True
+
+def convert(bibtex_file=BIBTEX_FILE, output_file=OUTPUT_FILE, authors_file=AUTHORS_FILE,
+            details_dir=DETAILS_DIR):
+    """
+    Convert the BibTeX file to the Jekyll data files.
+
+    Args:
+        bibtex_file: Path to the BibTeX source
+        output_file: Path of the publications YAML data file
+        authors_file: Path of the author index YAML data file
+        details_dir: Directory of the per-entry JSON detail files
+
+    Returns:
+        True on success, False if the BibTeX file is missing
+    """
+    bibtex_file = Path(bibtex_file)
+    output_file = Path(output_file)
+    authors_file = Path(authors_file)
 
     if not bibtex_file.exists():
         print(f"Error: {bibtex_file} not found!")
-        return
+        return False
 
     print(f"Reading BibTeX file: {bibtex_file}")
 
-    with open(bibtex_file, 'r', encoding='utf-8') as f:
-        parser = BibTexParser(common_strings=True)
-        parser.customization = convert_to_unicode
-        bib_database = bibtexparser.load(f, parser=parser)
+    entries = parse_bibtex_string(bibtex_file.read_text(encoding='utf-8'))
 
-    print(f"Found {len(bib_database.entries)} entries")
+    print(f"Found {len(entries)} entries")
 
     # Convert to list of dictionaries
-    publications = []
-    for entry in bib_database.entries:
-        pub_dict = bibtex_to_dict(entry)
-        publications.append(pub_dict)
-
-    # Sort by year (descending)
-    publications.sort(key=lambda x: x.get('year', '0000'), reverse=True)
-
-    # Ensure _data directory exists
-    output_file.parent.mkdir(exist_ok=True)
+    registry = AuthorRegistry()
+    publications = build_publications(entries, registry)
 
     # Write to YAML
     print(f"Writing to {output_file}")
-    with open(output_file, 'w', encoding='utf-8') as f:
-        yaml.dump(publications, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    if write_if_changed(output_file, dump_yaml(publications)):
+        print(f"✓ Created {output_file}")
+    else:
+        print(f"✓ {output_file} already up to date")
+
+    # Write author index (lets the page filter by author without parsing citations)
+    print(f"Writing {len(registry)} authors to {authors_file}")
+    if write_if_changed(authors_file, dump_yaml(registry.export())):
+        print(f"✓ Created {authors_file}")
+    else:
+        print(f"✓ {authors_file} already up to date")
+
+    # Write abstracts etc. as separate files so the main data file stays small
+    written, removed = write_details(entries, details_dir)
+    print(f"✓ Detail files in {details_dir}: {written} written, {removed} removed")
 
-    print(f"✓ Created {output_file}")
     print(f"\nNext steps:")
     print(f"1. Publications page will now read from _data/publications.yml")
     print(f"2. To update: edit .github/data/publications.bib and run this script")
     print(f"3. Jekyll will auto-reload (or restart: docker compose down && docker compose -f .github/dev/docker-compose.yaml up)")
+    return True
+
+def main():
+    convert()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Title matching and BibTeX formatting helpers shared by the publication scripts.
+
+Kept free of third-party imports so any script can use them without
+pulling in the arXiv client (and aiohttp).
+"""
+
+import re
+
+
+def normalize_title(title):
+    """Normalize title for comparison - removes punctuation and lowercases."""
+    title = title.lower()
+    # Remove all non-alphanumeric except spaces
+    title = re.sub(r'[^a-z0-9\s]', '', title)
+    # Normalize whitespace
+    title = ' '.join(title.split())
+    return title
+
+
+def calculate_title_similarity(title1, title2):
+    """
+    Calculate word-based similarity between two titles.
+
+    Returns:
+        Float between 0 and 1 (1 = perfect match)
+    """
+    words1 = set(title1.split())
+    words2 = set(title2.split())
+
+    if not words1 or not words2:
+        return 0.0
+
+    intersection = words1 & words2
+    union = words1 | words2
+
+    return len(intersection) / len(union)
+
+
+def format_bibtex_entry(entry):
+    """Format a BibTeX entry for writing, preserving ALL original fields."""
+    entry_type = entry.get('ENTRYTYPE', 'misc')
+    entry_id = entry.get('ID', 'unknown')
+
+    lines = [f"@{entry_type}{{{entry_id},"]
+
+    # Preferred order of fields for readability
+    field_order = [
+        'title', 'author', 'booktitle', 'journal', 'howpublished', 'publisher',
+        'pages', 'volume', 'number', 'year', 'month', 'organization',
+        'url_paper', 'url', 'pdf', 'doi', 'eprint', 'archivePrefix', 'primaryClass',
+        'url_code', 'local_code', 'code',
+        'url_slides', 'local_slides', 'slides',
+        'url_video', 'local_video', 'video',
+        'abstract', 'note'
+    ]
+
+    # Track which fields we've added
+    added_fields = set()
+
+    # Add fields in preferred order
+    for field in field_order:
+        if field in entry and field not in ['ENTRYTYPE', 'ID']:
+            value = entry[field]
+            lines.append(f"  {field} = {{{value}}},")
+            added_fields.add(field)
+
+    # Add any remaining fields not in the standard order (to preserve everything)
+    for field, value in sorted(entry.items()):
+        if field not in added_fields and field not in ['ENTRYTYPE', 'ID']:
+            lines.append(f"  {field} = {{{value}}},")
+
+    lines.append("}")
+
+    return "\n".join(lines)
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Validate paper/code/slides/video links of all BibTeX entries.
+
+External URLs are checked concurrently (HEAD, falling back to a ranged GET)
+with a per-host connection limit. Results are cached with their ETag and
+Last-Modified headers so later runs only issue conditional requests.
+local_* paths are checked against the files/ directory on disk.
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import aiohttp
+except ImportError:
+    print("Error: aiohttp library not found!")
+    print("Install it with: uv pip install aiohttp")
+    sys.exit(1)
+
+from bibtex_to_data import BIBTEX_FILE, parse_bibtex_string
+from checkpoint import atomic_write_text
+
+FILES_DIR = Path('files')
+CACHE_FILE = Path('.github/data/link_cache.json')
+
+MATERIALS = ['paper', 'code', 'slides', 'video']
+
+# Old field names still honoured by bibtex_to_data.get_material_url
+LEGACY_FIELDS = {
+    'paper': ['url', 'pdf'],
+    'code': ['code'],
+    'slides': ['slides'],
+    'video': ['video'],
+}
+
+# Statuses for which servers commonly reject HEAD but serve GET fine
+HEAD_UNSUPPORTED = {400, 403, 405, 501}
+
+
+def is_external(value):
+    """True for http(s) URLs, False for paths relative to files/."""
+    return value.startswith(('http://', 'https://'))
+
+
+def collect_links(entries):
+    """
+    Collect every material link of every entry.
+
+    Returns:
+        List of dictionaries with key, title, field and value
+    """
+    links = []
+    for entry in entries:
+        for material in MATERIALS:
+            fields = [f'url_{material}', f'local_{material}'] + LEGACY_FIELDS[material]
+            for field in fields:
+                value = entry.get(field, '').strip()
+                if value:
+                    links.append({
+                        'key': entry.get('ID', ''),
+                        'title': entry.get('title', ''),
+                        'year': entry.get('year', ''),
+                        'field': field,
+                        'value': value,
+                    })
+    return links
+
+
+def check_local(value, files_dir=FILES_DIR):
+    """
+    Check that a local material path exists under files/.
+
+    Returns:
+        Error message, or None if the file exists
+    """
+    if value.startswith('/'):
+        return "absolute path (must be relative to files/)"
+    if value.startswith('files/'):
+        return "includes 'files/' prefix (must be relative to files/)"
+    if not (Path(files_dir) / value).is_file():
+        return f"not found in {files_dir}/"
+    return None
+
+
+class LinkCache:
+    """
+    On-disk cache of URL check results.
+
+    Maps each URL to its last status, ETag, Last-Modified and check time.
+    """
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = Path(path)
+        self.results = {}
+        if self.path.exists():
+            try:
+                self.results = json.loads(self.path.read_text(encoding='utf-8'))
+            except json.JSONDecodeError:
+                print(f"⚠️  Ignoring corrupt link cache {self.path}")
+
+    def get(self, url):
+        return self.results.get(url)
+
+    def put(self, url, result):
+        self.results[url] = result
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(self.path, json.dumps(self.results, indent=1, sort_keys=True))
+
+
+def result_is_ok(result):
+    return result is not None and result.get('status') is not None and 200 <= result['status'] < 400
+
+
+async def fetch_status(session, method, url, headers):
+    """Issue a single request and return (status, response headers)."""
+    async with session.request(method, url, headers=headers, allow_redirects=True) as response:
+        return response.status, response.headers
+
+
+async def check_url(session, url, cached=None):
+    """
+    Check one URL, conditionally if a cached result with validators exists.
+
+    Returns:
+        Result dictionary (status, etag, last_modified, error, checked)
+    """
+    headers = {}
+    if result_is_ok(cached):
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    result = {'status': None, 'etag': '', 'last_modified': '', 'error': '', 'checked': time.time()}
+    try:
+        status, response_headers = await fetch_status(session, 'HEAD', url, headers)
+        if status in HEAD_UNSUPPORTED:
+            # Fall back to GET, asking for a single byte so bodies are not downloaded
+            status, response_headers = await fetch_status(
+                session, 'GET', url, dict(headers, Range='bytes=0-0'))
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        result['error'] = str(e) or type(e).__name__
+        return result
+
+    if status == 304 and cached:
+        # Unchanged since the last successful check
+        return dict(cached, checked=result['checked'])
+
+    result['status'] = status
+    result['etag'] = response_headers.get('ETag', '')
+    result['last_modified'] = response_headers.get('Last-Modified', '')
+    return result
+
+
+async def check_urls(urls, cache, concurrency=64, per_host=8, timeout=15.0, max_age=0):
+    """
+    Check many URLs concurrently, updating the cache in place.
+
+    Args:
+        urls: Iterable of URLs (duplicates are checked once)
+        cache: LinkCache instance
+        concurrency: Total connections in flight
+        per_host: Connections in flight per host
+        timeout: Per-request timeout in seconds
+        max_age: Reuse cached successful results younger than this (seconds)
+
+    Returns:
+        Dictionary url -> result
+    """
+    now = time.time()
+    results = {}
+    to_check = []
+    for url in dict.fromkeys(urls):
+        cached = cache.get(url)
+        if max_age and result_is_ok(cached) and now - cached.get('checked', 0) < max_age:
+            results[url] = cached
+        else:
+            to_check.append(url)
+
+    # Slots are taken before a request starts, so the timeout only counts
+    # time spent on the request itself, not time queued behind other URLs
+    # of the same host (the connector's own limits would count both).
+    slots = asyncio.Semaphore(concurrency)
+    host_slots = {}
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=0)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        headers={'User-Agent': 'Mozilla/5.0 (link checker; cciliber.github.io)'},
+    ) as session:
+        async def check_one(url):
+            host = host_slots.setdefault(urlsplit(url).netloc, asyncio.Semaphore(per_host))
+            async with host, slots:
+                result = await check_url(session, url, cache.get(url))
+            results[url] = result
+            cache.put(url, result)
+
+        await asyncio.gather(*(check_one(url) for url in to_check))
+
+    return results
+
+
+def check_links(bibtex_file=BIBTEX_FILE, files_dir=FILES_DIR, cache_file=CACHE_FILE,
+                concurrency=64, per_host=8, timeout=15.0, max_age=0):
+    """
+    Check all links and print a validation report.
+
+    Returns:
+        True if no link problems were found
+    """
+    bibtex_file = Path(bibtex_file)
+    if not bibtex_file.exists():
+        print(f"Error: {bibtex_file} not found!")
+        return False
+
+    entries = parse_bibtex_string(bibtex_file.read_text(encoding='utf-8'))
+    links = collect_links(entries)
+    external = [link['value'] for link in links if is_external(link['value'])]
+    hosts = {urlsplit(url).netloc for url in external}
+
+    print(f"Checking {len(set(external))} URLs on {len(hosts)} hosts and "
+          f"{len(links) - len(external)} local files...")
+
+    cache = LinkCache(cache_file)
+    start = time.perf_counter()
+    results = asyncio.run(check_urls(external, cache, concurrency, per_host, timeout, max_age))
+    elapsed = time.perf_counter() - start
+    cache.save()
+
+    # Problems per entry key
+    issues = {}
+    for link in links:
+        value = link['value']
+        if is_external(value):
+            result = results[value]
+            problem = None if result_is_ok(result) else (
+                f"HTTP {result['status']}" if result['status'] else result['error'])
+        else:
+            problem = check_local(value, files_dir)
+        if problem:
+            issues.setdefault(link['key'], []).append((link, problem))
+
+    linked_keys = {link['key'] for link in links}
+    without_links = [e for e in entries if e.get('ID', '') not in linked_keys]
+
+    print()
+    print("=" * 80)
+    print("PUBLICATION LINK VALIDATION REPORT")
+    print("=" * 80)
+    print()
+    print("Summary:")
+    print(f"  Total publications: {len(entries)}")
+    print(f"  ✓ With valid links: {len(linked_keys) - len(issues)}")
+    print(f"  ⚠ Without any links: {len(without_links)}")
+    print(f"  ✗ With link issues: {len(issues)}")
+    print(f"  Checked in {elapsed:.1f}s")
+
+    if without_links:
+        print()
+        print("Publications without links:")
+        for entry in without_links:
+            print(f"  ⚠ [{entry.get('year', '')}] {entry.get('title', '')[:70]}")
+            print(f"     BibTeX key: {entry.get('ID', '')}")
+
+    if issues:
+        print()
+        print("Publications with link issues:")
+        for key, problems in issues.items():
+            first = problems[0][0]
+            print(f"  ✗ [{first['year']}] {first['title'][:70]}")
+            print(f"     BibTeX key: {key}")
+            for link, problem in problems:
+                print(f"     - {link['field']}: {problem}")
+
+    return not issues
+
+
+def main():
+    """Main function."""
+    ok = check_links()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Crash-safe helpers for long-running publication scripts.
+Provides an append-only JSON-lines journal of per-entry results and atomic
+file replacement via temp-file-and-rename.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+
+def _target_mode(path):
+    """Permission bits for a file about to replace path."""
+    try:
+        return path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write_text(path, text, encoding='utf-8'):
+    """
+    Write text to path atomically.
+
+    The content goes to a temporary file in the same directory, is fsynced,
+    and then renamed over the target, so readers never see a partial file.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600 files: keep the target's mode, or use the umask default
+        os.chmod(tmp_name, _target_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+class Journal:
+    """
+    Append-only journal of per-entry results.
+
+    Each record is one JSON object per line. Records are flushed after every
+    write and fsynced in batches of `sync_every`, so a crash loses at most the
+    last unsynced batch. Use as a context manager so the tail is synced on
+    exit (including Ctrl-C).
+
+    A record is complete once its trailing newline is written; a partial
+    last line left by a crash is dropped when the journal is reopened, so
+    resumed records always start on a fresh line.
+    """
+
+    def __init__(self, path, sync_every=10):
+        self.path = Path(path)
+        self.sync_every = sync_every
+        self._file = None
+        self._unsynced = 0
+
+    def __enter__(self):
+        self._truncate_partial_line()
+        self._file = open(self.path, 'a', encoding='utf-8')
+        return self
+
+    def _truncate_partial_line(self, chunk_size=4096):
+        """Cut the file back to just after its last newline."""
+        try:
+            f = open(self.path, 'rb+')
+        except FileNotFoundError:
+            return
+        with f:
+            end = f.seek(0, os.SEEK_END)
+            pos = end
+            while pos > 0:
+                start = max(0, pos - chunk_size)
+                f.seek(start)
+                newline = f.read(pos - start).rfind(b'\n')
+                if newline >= 0:
+                    pos = start + newline + 1
+                    break
+                pos = start
+            if pos < end:
+                f.truncate(pos)
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def append(self, record):
+        """Append a record (a JSON-serializable dict)."""
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+
+    def sync(self):
+        """Force pending records to disk."""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def close(self):
+        """Sync and close the journal file."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        """Delete the journal once its results are safely written elsewhere."""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+
+    @staticmethod
+    def replay(path):
+        """
+        Read back all complete records from a journal.
+
+        A truncated last line (from a crash mid-write) and any line that
+        is not valid JSON are skipped.
+
+        Returns:
+            List of record dicts, in the order they were written
+        """
+        path = Path(path)
+        if not path.exists():
+            return []
+
+        records = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
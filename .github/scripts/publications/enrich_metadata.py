@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Enrich BibTeX entries with url_paper and doi from several bibliographic sources.
+
+For each entry every source (arXiv, Crossref, DBLP, Semantic Scholar) is
+queried in parallel; the first confident title match wins and the other
+lookups are cancelled. Each source has its own concurrency limit and
+timeout, and its endpoint can be overridden to point at a local server.
+"""
+
+import abc
+import asyncio
+import sys
+from pathlib import Path
+
+try:
+    import aiohttp
+except ImportError:
+    print("Error: aiohttp library not found!")
+    print("Install it with: uv pip install aiohttp")
+    sys.exit(1)
+
+from arxiv_client import ArxivClient, ARXIV_API_URL
+from bibtex_to_data import parse_bibtex_string
+from bibtex_utils import calculate_title_similarity, format_bibtex_entry, normalize_title
+from checkpoint import atomic_write_text
+
+
+class Source(abc.ABC):
+    """
+    Base class for a bibliographic source.
+
+    Subclasses set `name` and `base_url` and implement `search(title)`,
+    returning candidate dictionaries with 'title', 'url' and 'doi' keys.
+    """
+
+    name = None
+    base_url = None
+
+    def __init__(self, base_url=None, concurrency=2, timeout=10.0):
+        """
+        Args:
+            base_url: Endpoint override (e.g. a local stand-in server)
+            concurrency: Maximum number of requests in flight to this source
+            timeout: Seconds before a lookup is abandoned
+        """
+        if base_url:
+            self.base_url = base_url
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._semaphore = None
+        self.session = None
+
+    async def open(self, session):
+        """
+        Attach the shared HTTP session.
+
+        The semaphore is created here, inside the running event loop
+        (before Python 3.10 it binds to the loop current at creation).
+        """
+        self.session = session
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    async def close(self):
+        """Release resources owned by the source."""
+
+    @abc.abstractmethod
+    async def search(self, title):
+        """Return candidate dictionaries ('title', 'url', 'doi') for a title query."""
+
+    async def get_json(self, params, headers=None):
+        """GET base_url with query params and decode the JSON response."""
+        async with self.session.get(self.base_url, params=params, headers=headers) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def lookup(self, title, threshold, wanted=('url', 'doi')):
+        """
+        Search the source and return its best match above threshold.
+
+        Candidates that supply none of the wanted fields are ignored.
+
+        Returns:
+            Match dictionary (source, title, url, doi, score) or None
+        """
+        async with self._semaphore:
+            candidates = await asyncio.wait_for(self.search(title), self.timeout)
+
+        normalized = normalize_title(title)
+        best = None
+        for candidate in candidates:
+            if not any(candidate.get(field) for field in wanted):
+                continue
+            score = calculate_title_similarity(normalized, normalize_title(candidate['title']))
+            if score >= threshold and (best is None or score > best['score']):
+                best = dict(candidate, source=self.name, score=score)
+        return best
+
+
+class ArxivSource(Source):
+    """arXiv API, through the shared async client (keeps the arXiv rate limit)."""
+
+    name = 'arxiv'
+    base_url = ARXIV_API_URL
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.client = None
+
+    async def open(self, session):
+        await super().open(session)
+        client = ArxivClient(base_url=self.base_url, timeout=self.timeout)
+        await client.__aenter__()
+        self.client = client
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.__aexit__(None, None, None)
+            self.client = None
+
+    async def search(self, title):
+        results = await self.client.search(f'ti:"{title}"', max_results=5)
+        return [{'title': r['title'], 'url': r['entry_id'], 'doi': r['doi']} for r in results]
+
+
+class CrossrefSource(Source):
+    """Crossref REST API (api.crossref.org/works)."""
+
+    name = 'crossref'
+    base_url = 'https://api.crossref.org/works'
+
+    async def search(self, title):
+        data = await self.get_json({'query.bibliographic': title, 'rows': '5'})
+        candidates = []
+        for item in data.get('message', {}).get('items', []):
+            doi = item.get('DOI', '')
+            candidates.append({
+                'title': (item.get('title') or [''])[0],
+                'url': f'https://doi.org/{doi}' if doi else item.get('URL', ''),
+                'doi': doi,
+            })
+        return candidates
+
+
+class DBLPSource(Source):
+    """DBLP publication search API."""
+
+    name = 'dblp'
+    base_url = 'https://dblp.org/search/publ/api'
+
+    async def search(self, title):
+        data = await self.get_json({'q': title, 'format': 'json', 'h': '5'})
+        hits = data.get('result', {}).get('hits', {}).get('hit', [])
+        candidates = []
+        for hit in hits:
+            info = hit.get('info', {})
+            ee = info.get('ee', '')
+            # "ee" is a list when a paper has several electronic editions
+            if isinstance(ee, list):
+                ee = ee[0] if ee else ''
+            candidates.append({
+                'title': info.get('title', '').rstrip('.'),
+                'url': ee or info.get('url', ''),
+                'doi': info.get('doi', ''),
+            })
+        return candidates
+
+
+class SemanticScholarSource(Source):
+    """Semantic Scholar Graph API paper search."""
+
+    name = 'semanticscholar'
+    base_url = 'https://api.semanticscholar.org/graph/v1/paper/search'
+
+    async def search(self, title):
+        data = await self.get_json({
+            'query': title,
+            'limit': '5',
+            'fields': 'title,url,externalIds,openAccessPdf',
+        })
+        candidates = []
+        for paper in data.get('data') or []:
+            external = paper.get('externalIds') or {}
+            pdf = (paper.get('openAccessPdf') or {}).get('url', '')
+            arxiv_id = external.get('ArXiv')
+            url = pdf or (f'http://arxiv.org/abs/{arxiv_id}' if arxiv_id else paper.get('url', ''))
+            candidates.append({
+                'title': paper.get('title', ''),
+                'url': url,
+                'doi': external.get('DOI', ''),
+            })
+        return candidates
+
+
+# Available sources, in the order they are listed in reports
+SOURCES = {
+    source.name: source
+    for source in (ArxivSource, CrossrefSource, DBLPSource, SemanticScholarSource)
+}
+
+
+async def find_first_match(title, sources, threshold, wanted=('url', 'doi')):
+    """
+    Query all sources in parallel and return the first confident match.
+
+    A match is only confident if it supplies one of the wanted fields.
+    Lookups still running when a match arrives are cancelled. Source errors
+    and timeouts are reported and count as "no match" for that source.
+
+    Returns:
+        Match dictionary or None
+    """
+    tasks = {asyncio.ensure_future(source.lookup(title, threshold, wanted)): source for source in sources}
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            found = None
+            for task in done:
+                try:
+                    match = task.result()
+                except Exception as e:
+                    error = str(e) or type(e).__name__
+                    print(f"      ⚠️  {tasks[task].name} failed for '{title[:40]}': {error}")
+                    continue
+                found = found or match
+            if found:
+                return found
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def enrich_entries(entries, sources, on_result, concurrency=4, threshold=0.8):
+    """
+    Look up every entry across all sources.
+
+    Args:
+        entries: List of (index, entry) pairs
+        sources: Source instances (not yet opened)
+        on_result: Callback on_result(index, entry, match), match may be None
+        concurrency: Maximum number of entries processed at once
+        threshold: Minimum title similarity to accept a match
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=4),
+        headers={'User-Agent': 'cciliber.github.io publication scripts'},
+    ) as session:
+        try:
+            # close() is safe on sources whose open() failed or never ran
+            for source in sources:
+                await source.open(session)
+
+            async def enrich_one(index, entry):
+                async with semaphore:
+                    match = await find_first_match(entry.get('title', ''), sources, threshold,
+                                                   missing_fields(entry))
+                on_result(index, entry, match)
+
+            await asyncio.gather(*(enrich_one(i, entry) for i, entry in entries))
+        finally:
+            for source in sources:
+                await source.close()
+
+
+def missing_fields(entry):
+    """Match fields ('url', 'doi') that would fill a gap in the entry."""
+    missing = []
+    if not entry.get('url_paper'):
+        missing.append('url')
+    if not entry.get('doi'):
+        missing.append('doi')
+    return tuple(missing)
+
+
+def needs_enrichment(entry):
+    """An entry needs enrichment if it lacks a paper link or a DOI."""
+    return bool(missing_fields(entry))
+
+
+def enrich_bibtex(input_file, output_file, source_names=None, source_urls=None,
+                  concurrency=4, timeout=10.0, threshold=0.8):
+    """
+    Add missing url_paper and doi fields using all configured sources.
+
+    Args:
+        input_file: Path to input BibTeX file
+        output_file: Path to output BibTeX file
+        source_names: Names of sources to query (default: all)
+        source_urls: Optional dict of source name -> endpoint override
+        concurrency: Maximum number of entries processed at once
+        timeout: Per-source lookup timeout in seconds
+        threshold: Minimum title similarity to accept a match
+    """
+    source_names = source_names or list(SOURCES)
+    source_urls = source_urls or {}
+
+    unknown = [name for name in source_names if name not in SOURCES]
+    if unknown:
+        print(f"Error: unknown sources: {', '.join(unknown)} (available: {', '.join(SOURCES)})")
+        return False
+
+    print("=" * 80)
+    print("Metadata enrichment (" + ", ".join(source_names) + ")")
+    print("=" * 80)
+    print()
+
+    print(f"Reading BibTeX file: {input_file}")
+    entries = parse_bibtex_string(Path(input_file).read_text(encoding='utf-8'))
+    total = len(entries)
+    print(f"Found {total} entries\n")
+
+    pending = [(i, entry) for i, entry in enumerate(entries, 1) if needs_enrichment(entry)]
+    print(f"Looking up {len(pending)} entries without url_paper or doi...\n")
+
+    stats = {'matched': 0, 'not_matched': 0}
+    stats.update({name: 0 for name in source_names})
+
+    def on_result(i, entry, match):
+        print(f"[{i}/{total}] {entry.get('title', 'Unknown')[:60]}...")
+        if not match:
+            print("      ✗ No confident match")
+            stats['not_matched'] += 1
+            return
+
+        stats['matched'] += 1
+        stats[match['source']] += 1
+        print(f"      ✓ {match['source']} (score {match['score']:.2f})")
+        if match['url'] and not entry.get('url_paper'):
+            entry['url_paper'] = match['url']
+            print(f"        url_paper = {match['url']}")
+        if match['doi'] and not entry.get('doi'):
+            entry['doi'] = match['doi']
+            print(f"        doi = {match['doi']}")
+
+    sources = [SOURCES[name](base_url=source_urls.get(name), timeout=timeout) for name in source_names]
+    asyncio.run(enrich_entries(pending, sources, on_result, concurrency, threshold))
+
+    print(f"\n{'=' * 80}")
+    print("Writing updated BibTeX file...")
+    parts = [
+        "% Carlo Ciliberto - Publications\n",
+        "% BibTeX file enriched from " + ", ".join(source_names) + "\n",
+        f"% Total entries: {total}\n\n",
+    ]
+    for entry in entries:
+        parts.append(format_bibtex_entry(entry))
+        parts.append("\n\n")
+    atomic_write_text(output_file, ''.join(parts))
+
+    print(f"✓ Updated BibTeX file written to: {output_file}")
+    print()
+    print("=" * 80)
+    print("STATISTICS")
+    print("=" * 80)
+    print(f"Total entries:           {total}")
+    print(f"Looked up:               {len(pending)}")
+    print(f"Matched:                 {stats['matched']}")
+    for name in source_names:
+        print(f"  from {name:<19}{stats[name]}")
+    print(f"Not matched:             {stats['not_matched']}")
+    print()
+    return True
+
+
+def main():
+    """Main function."""
+    enrich_bibtex(
+        Path('.github/data/publications.bib'),
+        Path('.github/data/publications_enriched.bib'),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,13 @@ except ImportError:
     print("Install it with: uv pip install scholarly")
     sys.exit(1)
 
+from venues import VenueTable
+
+# Known venues and keywords, compiled once for all entries
+VENUES = VenueTable.load()
+
+SCHOLAR_URL = 'https://scholar.google.com'
+
 
 def setup_proxy():
     """Setup proxy to avoid rate limiting (optional)."""
@@ -24,6 +31,25 @@ def setup_proxy():
     pass
 
 
+def use_base_url(base_url):
+    """
+    Send Google Scholar requests to another server (e.g. a netreplay session).
+
+    scholarly has no endpoint option, so page requests for scholar.google.com
+    are rewritten on its navigator before they are fetched.
+    """
+    navigator = scholarly._Scholarly__nav
+    get_page = navigator._get_page
+    base_url = base_url.rstrip('/')
+
+    def get_rewritten_page(pagerequest, premium=False):
+        if pagerequest.startswith(SCHOLAR_URL):
+            pagerequest = base_url + pagerequest[len(SCHOLAR_URL):]
+        return get_page(pagerequest, premium)
+
+    navigator._get_page = get_rewritten_page
+
+
 def fetch_author_publications(author_name, author_id=None):
     """
     Fetch all publications for an author from Google Scholar.
@@ -104,17 +130,8 @@ def pub_to_bibtex(pub, index):
     last_name = first_author.split()[-1].lower().replace('.', '')
     key = f"{last_name}{year}_{index:02d}" if year else f"{last_name}_{index:02d}"
 
-    # Determine entry type based on venue
-    entry_type = 'inproceedings'  # Default
-    venue_lower = venue.lower() if venue else ''
-
-    if 'arxiv' in venue_lower or not venue:
-        entry_type = 'misc'
-        venue = 'arXiv' if 'arxiv' in venue_lower else 'Preprint'
-    elif 'journal' in venue_lower or any(j in venue_lower for j in ['ieee', 'acm', 'transactions']):
-        entry_type = 'article'
-    elif 'phd' in venue_lower or 'thesis' in venue_lower:
-        entry_type = 'phdthesis'
+    # Determine entry type and canonical venue name from the venue table
+    entry_type, venue = VENUES.classify(venue)
 
     # Build BibTeX entry
     lines = [f"@{entry_type}{{{key},"]
@@ -149,15 +166,29 @@ def pub_to_bibtex(pub, index):
     return "\n".join(lines)
 
 
-def main():
-    """Main function."""
-    # Configuration
-    AUTHOR_NAME = "Carlo Ciliberto"
-    # Google Scholar author ID for reliable results
-    # From: https://scholar.google.com/citations?user=XUcUAisAAAAJ
-    AUTHOR_ID = "XUcUAisAAAAJ"
+# Configuration
+AUTHOR_NAME = "Carlo Ciliberto"
+# Google Scholar author ID for reliable results
+# From: https://scholar.google.com/citations?user=XUcUAisAAAAJ
+AUTHOR_ID = "XUcUAisAAAAJ"
+OUTPUT_FILE = Path('files/publications_from_scholar.bib')
+
+
+def export_scholar_bibtex(output_file=OUTPUT_FILE, author_name=AUTHOR_NAME, author_id=AUTHOR_ID,
+                          base_url=None):
+    """
+    Fetch an author's publications from Google Scholar and write them as BibTeX.
+
+    Args:
+        output_file: Path of the BibTeX file to write
+        author_name: Name of the author
+        author_id: Optional Google Scholar author ID
+        base_url: Optional Google Scholar endpoint override
 
-    output_file = Path('files/publications_from_scholar.bib')
+    Returns:
+        True if the file was written, False otherwise
+    """
+    output_file = Path(output_file)
 
     print("=" * 80)
     print("Google Scholar to BibTeX Converter")
@@ -166,10 +197,12 @@ def main():
 
     # Setup proxy if needed
     setup_proxy()
+    if base_url:
+        use_base_url(base_url)
 
     # Fetch publications
     try:
-        publications = fetch_author_publications(AUTHOR_NAME, AUTHOR_ID)
+        publications = fetch_author_publications(author_name, author_id)
     except Exception as e:
         print(f"\n✗ Error: Google Scholar is blocking requests")
         print(f"   Details: {e}")
@@ -186,18 +219,18 @@ def main():
         print()
         print("3. Try again later (Google may have rate-limited your IP)")
         print()
-        return
+        return False
 
     if not publications:
         print("\nNo publications found!")
-        return
+        return False
 
     print(f"\n✓ Successfully fetched {len(publications)} publications")
     print(f"\nWriting to {output_file}...")
 
     # Write to BibTeX file
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"% {AUTHOR_NAME} - Publications from Google Scholar\n")
+        f.write(f"% {author_name} - Publications from Google Scholar\n")
         f.write(f"% Auto-generated from Google Scholar\n")
         f.write(f"% Total entries: {len(publications)}\n")
         f.write(f"% WARNING: This is a TEMPORARY file for review\n")
@@ -225,6 +258,12 @@ def main():
     print("Note: Google Scholar scraping can be slow and may hit rate limits.")
     print("      If you have many publications, this script may take several minutes.")
     print("      Consider setting AUTHOR_ID for more reliable results.")
+    return True
+
+
+def main():
+    """Main function."""
+    export_scholar_bibtex()
 
 
 if __name__ == "__main__":
@@ -8,33 +8,21 @@ import bibtexparser
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.customization import convert_to_unicode
 from pathlib import Path
-import re
-import sys
+import argparse
+import asyncio
 
-try:
-    import arxiv
-except ImportError:
-    print("Error: arxiv library not found!")
-    print("Install it with: uv pip install arxiv")
-    sys.exit(1)
+from arxiv_client import ArxivClient, ARXIV_API_URL, ARXIV_RATE_LIMIT
+from bibtex_utils import calculate_title_similarity, format_bibtex_entry, normalize_title
 
 
-def normalize_title(title):
-    """Normalize title for comparison - removes punctuation and lowercases."""
-    title = title.lower()
-    # Remove all non-alphanumeric except spaces
-    title = re.sub(r'[^a-z0-9\s]', '', title)
-    # Normalize whitespace
-    title = ' '.join(title.split())
-    return title
-
-
-def fetch_all_arxiv_papers(author_name):
+def fetch_all_arxiv_papers(author_name, base_url=ARXIV_API_URL, rate_limit=ARXIV_RATE_LIMIT):
     """
     Fetch all papers by an author from arXiv.
 
     Args:
         author_name: Author name (e.g., "Carlo Ciliberto" or "C. Ciliberto")
+        base_url: arXiv API endpoint (e.g. a local netreplay session)
+        rate_limit: Minimum seconds between requests
 
     Returns:
         Dictionary mapping normalized title to arXiv URL
@@ -43,21 +31,22 @@ def fetch_all_arxiv_papers(author_name):
     print("This may take a minute...")
     print()
 
-    # Search for all papers by author
-    search = arxiv.Search(
-        query=f'au:"{author_name}"',
-        max_results=500,  # Adjust if you have more papers
-        sort_by=arxiv.SortCriterion.SubmittedDate
-    )
-
     arxiv_papers = {}
-    client = arxiv.Client()
+
+    async def fetch():
+        async with ArxivClient(base_url=base_url, rate_limit=rate_limit) as client:
+            # Search for all papers by author
+            async for result in client.iter_all(
+                f'au:"{author_name}"',
+                max_results=500,  # Adjust if you have more papers
+                sort_by='submittedDate'
+            ):
+                normalized = normalize_title(result['title'])
+                arxiv_papers[normalized] = result['entry_id']
+                print(f"  ✓ {result['title'][:70]}...")
 
     try:
-        for result in client.results(search):
-            normalized = normalize_title(result.title)
-            arxiv_papers[normalized] = result.entry_id
-            print(f"  ✓ {result.title[:70]}...")
+        asyncio.run(fetch())
     except Exception as e:
         print(f"Error fetching arXiv papers: {e}")
         return {}
@@ -66,25 +55,6 @@ def fetch_all_arxiv_papers(author_name):
     return arxiv_papers
 
 
-def calculate_title_similarity(title1, title2):
-    """
-    Calculate word-based similarity between two titles.
-
-    Returns:
-        Float between 0 and 1 (1 = perfect match)
-    """
-    words1 = set(title1.split())
-    words2 = set(title2.split())
-
-    if not words1 or not words2:
-        return 0.0
-
-    intersection = words1 & words2
-    union = words1 | words2
-
-    return len(intersection) / len(union)
-
-
 def match_bibtex_to_arxiv(bibtex_entry, arxiv_papers, threshold=0.8):
     """
     Try to match a BibTeX entry to an arXiv paper.
@@ -120,7 +90,8 @@ def match_bibtex_to_arxiv(bibtex_entry, arxiv_papers, threshold=0.8):
     return best_match
 
 
-def update_bibtex_with_arxiv_matches(input_file, output_file, author_name):
+def update_bibtex_with_arxiv_matches(input_file, output_file, author_name,
+                                     base_url=ARXIV_API_URL, rate_limit=ARXIV_RATE_LIMIT):
     """
     Match BibTeX entries to arXiv papers and add url_paper fields.
 
@@ -128,6 +99,8 @@ def update_bibtex_with_arxiv_matches(input_file, output_file, author_name):
         input_file: Path to input BibTeX file
         output_file: Path to output BibTeX file
         author_name: Author name to search on arXiv
+        base_url: arXiv API endpoint
+        rate_limit: Minimum seconds between requests
     """
     print("=" * 80)
     print("arXiv Matcher - Match BibTeX entries to author's arXiv papers")
@@ -135,7 +108,7 @@ def update_bibtex_with_arxiv_matches(input_file, output_file, author_name):
     print()
 
     # Fetch all arXiv papers
-    arxiv_papers = fetch_all_arxiv_papers(author_name)
+    arxiv_papers = fetch_all_arxiv_papers(author_name, base_url, rate_limit)
 
     if not arxiv_papers:
         print("\nNo arXiv papers found or error occurred!")
@@ -235,46 +208,13 @@ def update_bibtex_with_arxiv_matches(input_file, output_file, author_name):
     print()
 
 
-def format_bibtex_entry(entry):
-    """Format a BibTeX entry for writing, preserving ALL original fields."""
-    entry_type = entry.get('ENTRYTYPE', 'misc')
-    entry_id = entry.get('ID', 'unknown')
-
-    lines = [f"@{entry_type}{{{entry_id},"]
-
-    # Preferred order of fields for readability
-    field_order = [
-        'title', 'author', 'booktitle', 'journal', 'howpublished', 'publisher',
-        'pages', 'volume', 'number', 'year', 'month', 'organization',
-        'url_paper', 'url', 'pdf', 'doi', 'eprint', 'archivePrefix', 'primaryClass',
-        'url_code', 'local_code', 'code',
-        'url_slides', 'local_slides', 'slides',
-        'url_video', 'local_video', 'video',
-        'abstract', 'note'
-    ]
-
-    # Track which fields we've added
-    added_fields = set()
-
-    # Add fields in preferred order
-    for field in field_order:
-        if field in entry and field not in ['ENTRYTYPE', 'ID']:
-            value = entry[field]
-            lines.append(f"  {field} = {{{value}}},")
-            added_fields.add(field)
-
-    # Add any remaining fields not in the standard order (to preserve everything)
-    for field, value in sorted(entry.items()):
-        if field not in added_fields and field not in ['ENTRYTYPE', 'ID']:
-            lines.append(f"  {field} = {{{value}}},")
-
-    lines.append("}")
-
-    return "\n".join(lines)
-
-
 def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description="Match BibTeX entries to an author's arXiv papers.")
+    parser.add_argument('-y', '--yes', action='store_true',
+                        help="do not ask for confirmation")
+    args = parser.parse_args()
+
     # Configuration
     AUTHOR_NAME = "Carlo Ciliberto"  # or "C. Ciliberto"
 
@@ -293,10 +233,11 @@ def main():
     print(f"Output: {output_file}")
     print()
 
-    response = input("Continue? [y/N] ")
-    if response.lower() != 'y':
-        print("Aborted.")
-        return
+    if not args.yes:
+        response = input("Continue? [y/N] ")
+        if response.lower() != 'y':
+            print("Aborted.")
+            return
 
     print()
     update_bibtex_with_arxiv_matches(input_file, output_file, AUTHOR_NAME)
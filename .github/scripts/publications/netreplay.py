@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Record and replay the HTTP traffic of the publication scripts.
+
+A local stand-in server sits in front of the remote APIs; each API is
+mounted under its own path prefix (/arxiv, /scholar, /crossref, ...) and
+the scripts are pointed at it through their base URL options.
+
+In record mode every request is forwarded to the real API and the
+exchange is appended to a gzip-compressed JSON-lines archive. In replay
+mode the archive is served offline, with the recorded (or a fixed)
+latency and optional error injection, so fetch strategies can be timed
+reproducibly without network access. Latency and injected errors are
+derived from the seed and the request itself, not from arrival order,
+so concurrent runs see the same conditions as sequential ones.
+
+Usage:
+    uv run python .github/scripts/publications/netreplay.py record
+    uv run python .github/scripts/publications/pubtools.py arxiv-search \\
+        --base-url http://127.0.0.1:8765/arxiv
+
+    uv run python .github/scripts/publications/netreplay.py replay --latency-ms 200 --error-rate 0.05
+    uv run python .github/scripts/publications/pubtools.py arxiv-search \\
+        --base-url http://127.0.0.1:8765/arxiv --rate-limit 0 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import base64
+import gzip
+import json
+import random
+import signal
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+try:
+    import aiohttp
+    from aiohttp import web
+except ImportError:
+    print("Error: aiohttp library not found!")
+    print("Install it with: uv pip install aiohttp")
+    sys.exit(1)
+
+ARCHIVE_FILE = Path('.github/data/network_session.jsonl.gz')
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Path prefix on the stand-in -> upstream base URL
+ROUTES = {
+    'arxiv': 'https://export.arxiv.org/api/query',
+    'scholar': 'https://scholar.google.com',
+    'crossref': 'https://api.crossref.org/works',
+    'dblp': 'https://dblp.org/search/publ/api',
+    'semanticscholar': 'https://api.semanticscholar.org/graph/v1/paper/search',
+}
+
+# Request headers passed on to the upstream API
+FORWARDED_REQUEST_HEADERS = ('Accept', 'User-Agent', 'Range', 'If-None-Match', 'If-Modified-Since')
+
+# Response headers kept in the archive (bodies are stored decoded)
+RECORDED_RESPONSE_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+def request_key(method, route, tail, query):
+    """
+    Archive key of a request: method, path and query with sorted parameters.
+
+    Args:
+        method: HTTP method
+        route: Route name (first path segment)
+        tail: Remaining path after the route ('' or '/...')
+        query: List of (name, value) query parameters
+    """
+    qs = urlencode(sorted(query))
+    return f"{method} /{route}{tail}" + (f"?{qs}" if qs else '')
+
+
+def encode_body(data):
+    """Store text bodies as-is and anything else as base64."""
+    try:
+        return {'body': data.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'body_b64': base64.b64encode(data).decode('ascii')}
+
+
+def decode_body(record):
+    if 'body_b64' in record:
+        return base64.b64decode(record['body_b64'])
+    return record.get('body', '').encode('utf-8')
+
+
+def load_archive(path):
+    """
+    Load a recorded session.
+
+    An archive whose recorder was killed has no gzip trailer and may end
+    in a partial line; everything up to the last complete record is kept.
+
+    Returns:
+        Dictionary key -> list of records, in recording order
+    """
+    exchanges = {}
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        try:
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                record = json.loads(line)
+                exchanges.setdefault(record['key'], []).append(record)
+        except EOFError:
+            print(f"⚠️  {path} is truncated (recorder not stopped cleanly), using the complete records")
+    return exchanges
+
+
+def parse_routes(items):
+    """
+    Build the route table from ROUTES and NAME=URL overrides.
+
+    Raises:
+        ValueError: If an item is not of the form NAME=URL
+    """
+    routes = dict(ROUTES)
+    for item in items:
+        name, _, url = item.partition('=')
+        if not name or not url:
+            raise ValueError(f"invalid route {item!r}, expected NAME=URL")
+        routes[name] = url.rstrip('/')
+    return routes
+
+
+class StandIn:
+    """
+    Local stand-in server for the remote APIs.
+
+    In 'record' mode requests are forwarded upstream and archived; in
+    'replay' mode they are answered from the archive. Repeated identical
+    requests are replayed in recording order (the last response is reused
+    once they run out).
+    """
+
+    def __init__(self, mode, archive=ARCHIVE_FILE, routes=None, latency_ms=None, jitter_ms=0.0,
+                 error_rate=0.0, error_status=503, seed=0, timeout=60.0):
+        """
+        Args:
+            mode: 'record' or 'replay'
+            archive: Path of the session archive
+            routes: Dictionary route name -> upstream base URL (default: ROUTES)
+            latency_ms: Fixed replay latency (default: the recorded latency)
+            jitter_ms: Extra random replay latency, uniform in [0, jitter_ms]
+            error_rate: Fraction of replayed requests answered with error_status
+            error_status: HTTP status used for injected errors
+            seed: Seed for jitter and error injection
+            timeout: Upstream timeout in seconds (record mode)
+        """
+        self.mode = mode
+        self.archive = Path(archive)
+        self.routes = routes or dict(ROUTES)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.seed = seed
+        self.timeout = timeout
+        self.stats = {'requests': 0, 'recorded': 0, 'replayed': 0, 'missing': 0, 'injected_errors': 0}
+        self._exchanges = {}
+        self._served = {}
+        self._session = None
+        self._file = None
+        self._runner = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Load or create the archive and start serving."""
+        if self.mode == 'record':
+            self.archive.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(self.archive, 'wt', encoding='utf-8')
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        else:
+            self._exchanges = load_archive(self.archive)
+
+        app = web.Application()
+        app.router.add_route('*', '/{route}{tail:.*}', self.handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+    async def close(self):
+        if self._runner:
+            await self._runner.cleanup()
+        if self._session:
+            await self._session.close()
+        if self._file:
+            self._file.close()
+
+    async def handle(self, request):
+        route = request.match_info['route']
+        tail = request.match_info['tail']
+        if route not in self.routes:
+            return web.Response(status=404, text=f"unknown route /{route}\n")
+
+        self.stats['requests'] += 1
+        key = request_key(request.method, route, tail, list(request.query.items()))
+        if self.mode == 'record':
+            return await self.forward(request, route, tail, key)
+        return await self.replay(key)
+
+    async def forward(self, request, route, tail, key):
+        """Send the request upstream, archive the exchange and relay the response."""
+        headers = {name: request.headers[name] for name in FORWARDED_REQUEST_HEADERS if name in request.headers}
+        data = await request.read()
+        start = time.perf_counter()
+        try:
+            async with self._session.request(request.method, self.routes[route] + tail,
+                                             params=list(request.query.items()),
+                                             headers=headers, data=data or None) as response:
+                body = await response.read()
+                status = response.status
+                kept = {name: response.headers[name]
+                        for name in RECORDED_RESPONSE_HEADERS if name in response.headers}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"  ✗ {key}: {str(e) or type(e).__name__}")
+            return web.Response(status=502, text=f"upstream error: {e}\n")
+        elapsed = time.perf_counter() - start
+
+        record = {'key': key, 'status': status, 'headers': kept, 'elapsed': round(elapsed, 4)}
+        record.update(encode_body(body))
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        # Sync-flush so the records so far can be decompressed even if the
+        # server is killed before close() writes the gzip trailer
+        self._file.flush()
+        self.stats['recorded'] += 1
+        print(f"  ● {status} {key[:100]} ({elapsed * 1000:.0f} ms, {len(body)} bytes)")
+        return web.Response(status=status, headers=kept, body=body)
+
+    async def replay(self, key):
+        """Answer a request from the archive with simulated latency and errors."""
+        records = self._exchanges.get(key)
+        if not records:
+            self.stats['missing'] += 1
+            print(f"  ✗ not recorded: {key[:100]}")
+            return web.Response(status=404, text="not recorded\n", headers={'X-Replay-Miss': '1'})
+
+        occurrence = self._served.get(key, 0)
+        self._served[key] = occurrence + 1
+        record = records[min(occurrence, len(records) - 1)]
+
+        # Depends only on the seed and the request, not on arrival order
+        rng = random.Random(f"{self.seed}:{key}:{occurrence}")
+        latency = record.get('elapsed', 0.0) if self.latency_ms is None else self.latency_ms / 1000
+        latency += rng.uniform(0, self.jitter_ms / 1000)
+        inject_error = rng.random() < self.error_rate
+        await asyncio.sleep(latency)
+
+        if inject_error:
+            self.stats['injected_errors'] += 1
+            return web.Response(status=self.error_status, text="injected error\n")
+        self.stats['replayed'] += 1
+        return web.Response(status=record['status'], headers=record.get('headers', {}),
+                            body=decode_body(record))
+
+
+async def serve(stand_in, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Run the stand-in until cancelled."""
+    await stand_in.start(host, port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stand_in.close()
+
+
+def run(stand_in, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """
+    Serve until Ctrl+C, then print request statistics.
+
+    Returns:
+        True on success, False if there is no archive to replay
+    """
+    if stand_in.mode == 'replay' and not stand_in.archive.exists():
+        print(f"Error: {stand_in.archive} not found! Record a session first.")
+        return False
+
+    print("=" * 80)
+    print(f"Network {stand_in.mode}: {stand_in.archive}")
+    print("=" * 80)
+    for name, url in stand_in.routes.items():
+        print(f"  http://{host}:{port}/{name:<16} -> {url}")
+    print("\nPress Ctrl+C to stop.\n")
+
+    def interrupt(signum, frame):
+        raise KeyboardInterrupt
+
+    # Stop cleanly (closing the archive) when killed as a background job too
+    signal.signal(signal.SIGTERM, interrupt)
+    try:
+        asyncio.run(serve(stand_in, host, port))
+    except KeyboardInterrupt:
+        pass
+
+    print()
+    print(", ".join(f"{name.replace('_', ' ')}: {count}" for name, count in stand_in.stats.items()))
+    return True
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Record or replay the network traffic of the scripts.")
+    subparsers = parser.add_subparsers(dest='mode', metavar='MODE')
+    subparsers.required = True
+
+    for mode, help_text in (('record', "forward requests upstream and archive them"),
+                            ('replay', "serve archived responses offline")):
+        p = subparsers.add_parser(mode, help=help_text)
+        p.add_argument('--archive', default=ARCHIVE_FILE, help="session archive (default: %(default)s)")
+        p.add_argument('--host', default=DEFAULT_HOST, help="listen address (default: %(default)s)")
+        p.add_argument('--port', type=int, default=DEFAULT_PORT, help="listen port (default: %(default)s)")
+        p.add_argument('--route', action='append', default=[], metavar='NAME=URL',
+                       help="add or override an upstream, e.g. geocoder=https://nominatim.openstreetmap.org/search")
+        if mode == 'replay':
+            p.add_argument('--latency-ms', type=float, default=None,
+                           help="fixed latency per request (default: as recorded)")
+            p.add_argument('--jitter-ms', type=float, default=0.0,
+                           help="extra random latency up to this value (default: %(default)s)")
+            p.add_argument('--error-rate', type=float, default=0.0,
+                           help="fraction of requests answered with an error (default: %(default)s)")
+            p.add_argument('--error-status', type=int, default=503,
+                           help="HTTP status of injected errors (default: %(default)s)")
+            p.add_argument('--seed', type=int, default=0, help="seed for jitter and errors (default: %(default)s)")
+    args = parser.parse_args()
+
+    try:
+        routes = parse_routes(args.route)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.mode == 'record':
+        stand_in = StandIn('record', args.archive, routes)
+    else:
+        stand_in = StandIn('replay', args.archive, routes, args.latency_ms, args.jitter_ms,
+                           args.error_rate, args.error_status, args.seed)
+
+    ok = run(stand_in, args.host, args.port)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Index the PDFs in files/ and optionally link them to BibTeX entries.
+
+For every PDF the title, page count, size and a first-page thumbnail are
+extracted. Results are cached keyed by file modification time and size,
+so re-runs only open new or modified files; those are processed in
+parallel across all cores.
+
+With --link, each indexed PDF is matched against the bibliography by
+title, and entries without a local_paper/local_slides field get one
+pointing at the matching file (slides*.pdf or slides/ -> local_slides,
+paper*.pdf or papers/ -> local_paper). The result is written to a separate BibTeX file.
+
+Usage:
+    uv run python .github/scripts/publications/pdf_index.py
+    uv run python .github/scripts/publications/pdf_index.py --link
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import pymupdf
+except ImportError:
+    print("Error: PyMuPDF library not found!")
+    print("Install it with: uv pip install pymupdf")
+    sys.exit(1)
+
+from bibtex_to_data import BIBTEX_FILE, parse_bibtex_string
+from bibtex_utils import calculate_title_similarity, format_bibtex_entry, normalize_title
+from checkpoint import atomic_write_text
+
+FILES_DIR = Path('files')
+INDEX_FILE = Path('.github/data/pdf_index.json')
+# Kept out of files/ so Jekyll does not publish them
+THUMBNAIL_DIR = Path('.github/data/pdf_thumbnails')
+LINKED_OUTPUT_FILE = Path('.github/data/publications_linked.bib')
+
+THUMBNAIL_WIDTH = 320
+
+# Bump when the extracted fields or thumbnail settings change
+INDEX_VERSION = 1
+
+# Metadata titles produced by tools rather than authors
+PLACEHOLDER_TITLES = ('untitled', 'microsoft word', 'microsoft powerpoint', 'powerpoint presentation',
+                      'slide 1', 'main', 'paper', 'arxiv')
+
+
+def material_for(name):
+    """
+    BibTeX material a PDF provides, judged by its directory or file name.
+
+    slides1.pdf and slides/talk.pdf are slides, paper1.pdf and papers/x.pdf
+    are papers; anything else (e.g. the CV) is not linked.
+    """
+    path = Path(name.lower())
+    for part in (path.parts[0], path.stem):
+        if part.startswith('slides'):
+            return 'slides'
+        if part.startswith('paper'):
+            return 'paper'
+    return None
+
+
+def is_placeholder_title(title):
+    """True if a metadata title is empty or was filled in by the authoring tool."""
+    lowered = title.strip().lower()
+    if len(lowered.split()) < 2:
+        return True
+    if lowered.endswith(('.pdf', '.dvi', '.tex', '.doc', '.docx', '.ppt', '.pptx')):
+        return True
+    return lowered.startswith(PLACEHOLDER_TITLES)
+
+
+def first_page_title(page):
+    """
+    Guess the title of a document from its first page.
+
+    Takes the lines set in the largest font size on the upper half of the page.
+
+    Returns:
+        Title string ('' if the page has no text)
+    """
+    lines = []
+    for block in page.get_text('dict')['blocks']:
+        for line in block.get('lines', []):
+            text = ' '.join(span['text'].strip() for span in line['spans'] if span['text'].strip())
+            if not text or line['bbox'][1] > page.rect.height / 2:
+                continue
+            size = max(round(span['size'], 1) for span in line['spans'])
+            lines.append((size, text))
+    if not lines:
+        return ''
+    largest = max(size for size, _ in lines)
+    return ' '.join(text for size, text in lines if size == largest)
+
+
+def index_pdf(job):
+    """
+    Extract metadata and render a thumbnail for one PDF (runs in a worker process).
+
+    Args:
+        job: Tuple (path, relative name, thumbnail path, mtime_ns, size)
+
+    Returns:
+        Index record for the file
+    """
+    path, name, thumbnail, mtime_ns, size = job
+    record = {
+        'version': INDEX_VERSION,
+        'mtime_ns': mtime_ns,
+        'size': size,
+        'title': '',
+        'pages': 0,
+        'thumbnail': '',
+        'error': '',
+    }
+    try:
+        with pymupdf.open(path) as doc:
+            record['pages'] = doc.page_count
+            title = (doc.metadata or {}).get('title') or ''
+            if doc.page_count:
+                page = doc[0]
+                if is_placeholder_title(title):
+                    title = first_page_title(page)
+                scale = THUMBNAIL_WIDTH / page.rect.width
+                page.get_pixmap(matrix=pymupdf.Matrix(scale, scale)).save(thumbnail)
+                record['thumbnail'] = Path(thumbnail).as_posix()
+            record['title'] = ' '.join(title.split())
+    except (RuntimeError, ValueError) as e:
+        record['error'] = str(e) or type(e).__name__
+    return record
+
+
+def thumbnail_name(name):
+    """Thumbnail file name for a PDF path relative to files/."""
+    return Path(name).with_suffix('').as_posix().replace('/', '_') + '.png'
+
+
+def load_index(path):
+    """Load the cached index ({} if missing or corrupt)."""
+    try:
+        return json.loads(Path(path).read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def is_current(record, stat, thumbnail_dir):
+    """True if a cached record matches the file's mtime and size and its thumbnail exists."""
+    if not record or record.get('version') != INDEX_VERSION:
+        return False
+    if record.get('mtime_ns') != stat.st_mtime_ns or record.get('size') != stat.st_size:
+        return False
+    return not record.get('thumbnail') or (thumbnail_dir / Path(record['thumbnail']).name).exists()
+
+
+def build_index(files_dir=FILES_DIR, index_file=INDEX_FILE, thumbnail_dir=THUMBNAIL_DIR, workers=None):
+    """
+    Index all PDFs under files_dir, re-processing only new or modified files.
+
+    Args:
+        files_dir: Directory of PDFs (paths are recorded relative to it)
+        index_file: JSON cache of index records
+        thumbnail_dir: Directory for first-page thumbnails
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Dictionary relative PDF path -> record
+    """
+    files_dir = Path(files_dir)
+    thumbnail_dir = Path(thumbnail_dir)
+    thumbnail_dir.mkdir(parents=True, exist_ok=True)
+
+    cached = load_index(index_file)
+    index = {}
+    jobs = []
+    for path in sorted(files_dir.rglob('*.pdf')):
+        name = path.relative_to(files_dir).as_posix()
+        stat = path.stat()
+        if is_current(cached.get(name), stat, thumbnail_dir):
+            index[name] = cached[name]
+        else:
+            thumbnail = thumbnail_dir / thumbnail_name(name)
+            jobs.append((str(path), name, str(thumbnail), stat.st_mtime_ns, stat.st_size))
+
+    print(f"Found {len(index) + len(jobs)} PDFs in {files_dir}")
+    print(f"Unchanged: {len(index)}, to index: {len(jobs)}")
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            for job, record in zip(jobs, pool.map(index_pdf, jobs)):
+                index[job[1]] = record
+                if record['error']:
+                    print(f"  ✗ {job[1]}: {record['error']}")
+                else:
+                    print(f"  ✓ {job[1]} ({record['pages']} pages) {record['title'][:60]}")
+
+    # Remove thumbnails of deleted files
+    keep = {Path(record['thumbnail']).name for record in index.values() if record.get('thumbnail')}
+    for path in thumbnail_dir.glob('*.png'):
+        if path.name not in keep:
+            path.unlink()
+
+    Path(index_file).parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_text(index_file, json.dumps(dict(sorted(index.items())), indent=1))
+    return index
+
+
+def find_links(index, entries, threshold=0.8):
+    """
+    Match indexed PDFs to BibTeX entries by title.
+
+    Each PDF is linked to the entry with the most similar title, provided
+    the similarity reaches threshold, the entry has no local file of that
+    material yet and no other entry already references the file. When
+    several PDFs match the same entry and material, only the best scoring
+    one is linked.
+
+    Returns:
+        List of (entry, field, pdf name, score) tuples
+    """
+    referenced = {entry.get(f'local_{material}', '').strip()
+                  for entry in entries for material in ('paper', 'slides')}
+    titles = [(entry, normalize_title(entry.get('title', '').replace('{', '').replace('}', '')))
+              for entry in entries]
+
+    # (entry ID, field) -> best link claiming it
+    claimed = {}
+    for name, record in sorted(index.items()):
+        material = material_for(name)
+        if not material or not record.get('title') or name in referenced:
+            continue
+        pdf_title = normalize_title(record['title'])
+        best, best_score = None, 0.0
+        for entry, title in titles:
+            score = calculate_title_similarity(pdf_title, title)
+            if score > best_score:
+                best, best_score = entry, score
+        field = f'local_{material}'
+        if best is None or best_score < threshold or best.get(field):
+            continue
+        key = (best.get('ID', ''), field)
+        if key not in claimed or best_score > claimed[key][3]:
+            claimed[key] = (best, field, name, best_score)
+    return sorted(claimed.values(), key=lambda link: link[2])
+
+
+def link_bibtex(index, bibtex_file=BIBTEX_FILE, output_file=LINKED_OUTPUT_FILE, threshold=0.8):
+    """
+    Add local_paper/local_slides fields for PDFs matching BibTeX entries.
+
+    Also reports local_* fields that point at PDFs missing from the index.
+
+    Returns:
+        Number of links added
+    """
+    entries = parse_bibtex_string(Path(bibtex_file).read_text(encoding='utf-8'))
+
+    missing = [(entry.get('ID', ''), field, entry[field])
+               for entry in entries for field in ('local_paper', 'local_slides')
+               if entry.get(field, '').lower().endswith('.pdf') and entry[field] not in index]
+    for key, field, value in missing:
+        print(f"  ⚠️  {key}: {field} = {value} is not in the index")
+
+    links = find_links(index, entries, threshold)
+    for entry, field, name, score in links:
+        entry[field] = name
+        print(f"  ✓ {entry.get('ID', '')}: {field} = {name} (score {score:.2f})")
+
+    if links:
+        parts = [
+            "% Carlo Ciliberto - Publications\n",
+            "% BibTeX file with local PDFs linked by title\n",
+            f"% Total entries: {len(entries)}\n\n",
+        ]
+        for entry in entries:
+            parts.append(format_bibtex_entry(entry))
+            parts.append("\n\n")
+        atomic_write_text(output_file, ''.join(parts))
+        print(f"✓ Updated BibTeX file written to: {output_file}")
+    else:
+        print("No new links found")
+    return len(links)
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Index local PDFs and link them to BibTeX entries.")
+    parser.add_argument('--files-dir', default=FILES_DIR, help="PDF directory (default: %(default)s)")
+    parser.add_argument('--index', default=INDEX_FILE, help="index cache (default: %(default)s)")
+    parser.add_argument('--thumbnail-dir', default=THUMBNAIL_DIR, help="thumbnails (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--link', action='store_true', help="add local_* fields for PDFs matching entries")
+    parser.add_argument('--input', default=BIBTEX_FILE, help="BibTeX source (default: %(default)s)")
+    parser.add_argument('--output', default=LINKED_OUTPUT_FILE, help="BibTeX output (default: %(default)s)")
+    parser.add_argument('--threshold', type=float, default=0.8,
+                        help="minimum title similarity (default: %(default)s)")
+    args = parser.parse_args()
+
+    index = build_index(args.files_dir, args.index, args.thumbnail_dir, args.workers)
+    if args.link:
+        print()
+        link_bibtex(index, args.input, args.output, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
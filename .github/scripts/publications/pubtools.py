@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the publication management scripts.
+
+Each subcommand imports only the modules it needs, so `--help` and
+`to-data` never pay for scholarly or the async HTTP stack. All commands run
+non-interactively.
+
+Usage:
+    uv run python .github/scripts/publications/pubtools.py to-data
+    uv run python .github/scripts/publications/pubtools.py watch
+    uv run python .github/scripts/publications/pubtools.py arxiv-match --author "Carlo Ciliberto"
+    uv run python .github/scripts/publications/pubtools.py arxiv-search --resume
+    uv run python .github/scripts/publications/pubtools.py enrich --sources crossref,dblp
+    uv run python .github/scripts/publications/pubtools.py check-links
+    uv run python .github/scripts/publications/pubtools.py scholar-fetch
+    uv run python .github/scripts/publications/pubtools.py index-pdfs --link
+    uv run python .github/scripts/publications/pubtools.py net-replay --latency-ms 200
+"""
+
+import argparse
+import sys
+
+# Defaults are repeated here (rather than imported) to keep startup import-free
+BIBTEX_FILE = '.github/data/publications.bib'
+ARXIV_OUTPUT_FILE = '.github/data/publications_with_arxiv.bib'
+ENRICHED_OUTPUT_FILE = '.github/data/publications_enriched.bib'
+LINKED_OUTPUT_FILE = '.github/data/publications_linked.bib'
+SCHOLAR_OUTPUT_FILE = 'files/publications_from_scholar.bib'
+DATA_FILE = '_data/publications.yml'
+DETAILS_DIR = 'assets/publications'
+FILES_DIR = 'files'
+LINK_CACHE_FILE = '.github/data/link_cache.json'
+PDF_INDEX_FILE = '.github/data/pdf_index.json'
+THUMBNAIL_DIR = '.github/data/pdf_thumbnails'
+AUTHORS_FILE = '_data/publication_authors.yml'
+AUTHOR_NAME = 'Carlo Ciliberto'
+SCHOLAR_AUTHOR_ID = 'XUcUAisAAAAJ'
+ARXIV_API_URL = 'https://export.arxiv.org/api/query'
+ARXIV_RATE_LIMIT = 3.0
+NETWORK_ARCHIVE_FILE = '.github/data/network_session.jsonl.gz'
+
+
+def cmd_to_data(args):
+    """Convert BibTeX to the Jekyll data files."""
+    import bibtex_to_data
+
+    ok = bibtex_to_data.convert(args.input, args.output, args.authors_output, args.details_dir)
+    return 0 if ok else 1
+
+
+def cmd_watch(args):
+    """Regenerate the Jekyll data files whenever the BibTeX file changes."""
+    import watch_bibtex
+
+    ok = watch_bibtex.watch(args.input, args.output, args.authors_output, args.details_dir,
+                            interval=args.interval, use_inotify=not args.poll)
+    return 0 if ok else 1
+
+
+def cmd_arxiv_match(args):
+    """Match BibTeX entries against all arXiv papers of an author."""
+    import match_arxiv_by_author
+
+    match_arxiv_by_author.update_bibtex_with_arxiv_matches(args.input, args.output, args.author,
+                                                           args.base_url, args.rate_limit)
+    return 0
+
+
+def cmd_arxiv_search(args):
+    """Search arXiv title-by-title for entries without url_paper."""
+    import add_arxiv_urls
+
+    add_arxiv_urls.update_bibtex_with_arxiv(
+        args.input, args.output,
+        concurrency=args.concurrency,
+        base_url=args.base_url,
+        resume=args.resume,
+        rate_limit=args.rate_limit,
+    )
+    return 0
+
+
+def cmd_enrich(args):
+    """Fill missing url_paper/doi fields from several sources in parallel."""
+    import enrich_metadata
+
+    source_urls = {}
+    for item in args.source_url:
+        name, _, url = item.partition('=')
+        source_urls[name] = url
+
+    ok = enrich_metadata.enrich_bibtex(
+        args.input, args.output,
+        source_names=args.sources.split(',') if args.sources else None,
+        source_urls=source_urls,
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        threshold=args.threshold,
+    )
+    return 0 if ok else 1
+
+
+def cmd_check_links(args):
+    """Validate url_*/local_* links of all entries."""
+    import check_links
+
+    ok = check_links.check_links(
+        args.input, args.files_dir, args.cache,
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        timeout=args.timeout,
+        max_age=args.max_age * 3600,
+    )
+    return 0 if ok else 1
+
+
+def cmd_scholar_fetch(args):
+    """Export an author's Google Scholar publications to BibTeX."""
+    import google_scholar_to_bibtex
+
+    ok = google_scholar_to_bibtex.export_scholar_bibtex(args.output, args.author, args.author_id,
+                                                        base_url=args.base_url)
+    return 0 if ok else 1
+
+
+def cmd_index_pdfs(args):
+    """Index the PDFs in files/ and optionally link them to BibTeX entries."""
+    import pdf_index
+
+    index = pdf_index.build_index(args.files_dir, args.index, args.thumbnail_dir, args.workers)
+    if args.link:
+        print()
+        pdf_index.link_bibtex(index, args.input, args.output, args.threshold)
+    return 0
+
+
+def cmd_net(args):
+    """Record or replay the HTTP traffic of the other commands."""
+    import netreplay
+
+    try:
+        routes = netreplay.parse_routes(args.route)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    if args.command == 'net-record':
+        stand_in = netreplay.StandIn('record', args.archive, routes)
+    else:
+        stand_in = netreplay.StandIn('replay', args.archive, routes, latency_ms=args.latency_ms,
+                                     jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                                     error_status=args.error_status, seed=args.seed)
+    ok = netreplay.run(stand_in, args.host, args.port)
+    return 0 if ok else 1
+
+
+def build_parser():
+    """Build the argument parser with one sub-parser per command."""
+    parser = argparse.ArgumentParser(
+        prog='pubtools',
+        description="Publication management tools for the website.",
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    subparsers.required = True
+
+    p = subparsers.add_parser('to-data', help="convert BibTeX to _data/publications.yml")
+    p.add_argument('--input', default=BIBTEX_FILE, help="BibTeX source (default: %(default)s)")
+    p.add_argument('--output', default=DATA_FILE, help="publications data file (default: %(default)s)")
+    p.add_argument('--authors-output', default=AUTHORS_FILE,
+                   help="author index data file (default: %(default)s)")
+    p.add_argument('--details-dir', default=DETAILS_DIR,
+                   help="per-entry abstract JSON files (default: %(default)s)")
+    p.set_defaults(func=cmd_to_data)
+
+    p = subparsers.add_parser('watch', help="re-run to-data whenever the BibTeX file changes")
+    p.add_argument('--input', default=BIBTEX_FILE, help="BibTeX source (default: %(default)s)")
+    p.add_argument('--output', default=DATA_FILE, help="publications data file (default: %(default)s)")
+    p.add_argument('--authors-output', default=AUTHORS_FILE,
+                   help="author index data file (default: %(default)s)")
+    p.add_argument('--details-dir', default=DETAILS_DIR,
+                   help="per-entry abstract JSON files (default: %(default)s)")
+    p.add_argument('--poll', action='store_true', help="poll for changes instead of using inotify")
+    p.add_argument('--interval', type=float, default=1.0,
+                   help="polling interval in seconds (default: %(default)s)")
+    p.set_defaults(func=cmd_watch)
+
+    p = subparsers.add_parser('arxiv-match', help="add arXiv URLs by fetching all papers of an author")
+    p.add_argument('--input', default=BIBTEX_FILE, help="BibTeX source (default: %(default)s)")
+    p.add_argument('--output', default=ARXIV_OUTPUT_FILE, help="BibTeX output (default: %(default)s)")
+    p.add_argument('--author', default=AUTHOR_NAME, help="arXiv author name (default: %(default)s)")
+    p.add_argument('--base-url', default=ARXIV_API_URL, help="arXiv API endpoint (default: %(default)s)")
+    p.add_argument('--rate-limit', type=float, default=ARXIV_RATE_LIMIT,
+                   help="seconds between arXiv requests (default: %(default)s)")
+    p.set_defaults(func=cmd_arxiv_match)
+
+    p = subparsers.add_parser('arxiv-search', help="add arXiv URLs by searching each title")
+    p.add_argument('--input', default=BIBTEX_FILE, help="BibTeX source (default: %(default)s)")
+    p.add_argument('--output', default=ARXIV_OUTPUT_FILE, help="BibTeX output (default: %(default)s)")
+    p.add_argument('--concurrency', type=int, default=4,
+                   help="arXiv requests in flight (default: %(default)s)")
+    p.add_argument('--base-url', default=None, help="override the arXiv API endpoint")
+    p.add_argument('--resume', action='store_true', help="continue an interrupted run from its journal")
+    p.add_argument('--rate-limit', type=float, default=None,
+                   help="seconds between arXiv requests (default: 3; lower only for a local server)")
+    p.set_defaults(func=cmd_arxiv_search)
+
+    p = subparsers.add_parser('enrich', help="add url_paper/doi from arXiv, Crossref, DBLP and Semantic Scholar")
+    p.add_argument('--input', default=BIBTEX_FILE, help="BibTeX source (default: %(default)s)")
+    p.add_argument('--output', default=ENRICHED_OUTPUT_FILE, help="BibTeX output (default: %(default)s)")
+    p.add_argument('--sources', default=None,
+                   help="comma-separated sources (default: arxiv,crossref,dblp,semanticscholar)")
+    p.add_argument('--source-url', action='append', default=[], metavar='NAME=URL',
+                   help="override a source endpoint, e.g. crossref=http://localhost:8000/works")
+    p.add_argument('--concurrency', type=int, default=4,
+                   help="entries looked up at once (default: %(default)s)")
+    p.add_argument('--timeout', type=float, default=10.0,
+                   help="per-source timeout in seconds (default: %(default)s)")
+    p.add_argument('--threshold', type=float, default=0.8,
+                   help="minimum title similarity (default: %(default)s)")
+    p.set_defaults(func=cmd_enrich)
+
+    p = subparsers.add_parser('check-links', help="validate paper/code/slides/video links")
+    p.add_argument('--input', default=BIBTEX_FILE, help="BibTeX source (default: %(default)s)")
+    p.add_argument('--files-dir', default=FILES_DIR, help="directory of local_* files (default: %(default)s)")
+    p.add_argument('--cache', default=LINK_CACHE_FILE, help="link status cache (default: %(default)s)")
+    p.add_argument('--concurrency', type=int, default=64,
+                   help="total requests in flight (default: %(default)s)")
+    p.add_argument('--per-host', type=int, default=8,
+                   help="requests in flight per host (default: %(default)s)")
+    p.add_argument('--timeout', type=float, default=15.0,
+                   help="per-request timeout in seconds (default: %(default)s)")
+    p.add_argument('--max-age', type=float, default=0,
+                   help="skip URLs that passed within this many hours (default: always re-check)")
+    p.set_defaults(func=cmd_check_links)
+
+    p = subparsers.add_parser('scholar-fetch', help="export Google Scholar publications to BibTeX")
+    p.add_argument('--output', default=SCHOLAR_OUTPUT_FILE, help="BibTeX output (default: %(default)s)")
+    p.add_argument('--author', default=AUTHOR_NAME, help="author name (default: %(default)s)")
+    p.add_argument('--author-id', default=SCHOLAR_AUTHOR_ID,
+                   help="Google Scholar author ID (default: %(default)s)")
+    p.add_argument('--base-url', default=None, help="override the Google Scholar endpoint")
+    p.set_defaults(func=cmd_scholar_fetch)
+
+    p = subparsers.add_parser('index-pdfs', help="index PDFs in files/ (title, pages, thumbnail)")
+    p.add_argument('--files-dir', default=FILES_DIR, help="PDF directory (default: %(default)s)")
+    p.add_argument('--index', default=PDF_INDEX_FILE, help="index cache (default: %(default)s)")
+    p.add_argument('--thumbnail-dir', default=THUMBNAIL_DIR, help="thumbnails (default: %(default)s)")
+    p.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    p.add_argument('--link', action='store_true', help="add local_* fields for PDFs matching entries")
+    p.add_argument('--input', default=BIBTEX_FILE, help="BibTeX source (default: %(default)s)")
+    p.add_argument('--output', default=LINKED_OUTPUT_FILE, help="BibTeX output (default: %(default)s)")
+    p.add_argument('--threshold', type=float, default=0.8,
+                   help="minimum title similarity (default: %(default)s)")
+    p.set_defaults(func=cmd_index_pdfs)
+
+    p = subparsers.add_parser('net-record', help="record the network traffic of other commands")
+    p.add_argument('--archive', default=NETWORK_ARCHIVE_FILE, help="session archive (default: %(default)s)")
+    p.add_argument('--host', default='127.0.0.1', help="listen address (default: %(default)s)")
+    p.add_argument('--port', type=int, default=8765, help="listen port (default: %(default)s)")
+    p.add_argument('--route', action='append', default=[], metavar='NAME=URL',
+                   help="add or override an upstream, e.g. arxiv=http://localhost:8000/api/query")
+    p.set_defaults(func=cmd_net)
+
+    p = subparsers.add_parser('net-replay', help="serve a recorded session offline")
+    p.add_argument('--archive', default=NETWORK_ARCHIVE_FILE, help="session archive (default: %(default)s)")
+    p.add_argument('--host', default='127.0.0.1', help="listen address (default: %(default)s)")
+    p.add_argument('--port', type=int, default=8765, help="listen port (default: %(default)s)")
+    p.add_argument('--route', action='append', default=[], metavar='NAME=URL',
+                   help="add or override an upstream, e.g. arxiv=http://localhost:8000/api/query")
+    p.add_argument('--latency-ms', type=float, default=None,
+                   help="fixed latency per request (default: as recorded)")
+    p.add_argument('--jitter-ms', type=float, default=0.0,
+                   help="extra random latency up to this value (default: %(default)s)")
+    p.add_argument('--error-rate', type=float, default=0.0,
+                   help="fraction of requests answered with an error (default: %(default)s)")
+    p.add_argument('--error-status', type=int, default=503,
+                   help="HTTP status of injected errors (default: %(default)s)")
+    p.add_argument('--seed', type=int, default=0, help="seed for jitter and errors (default: %(default)s)")
+    p.set_defaults(func=cmd_net)
+
+    return parser
+
+
+def main(argv=None):
+    """Main function."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Tests for arxiv_client.py against a local fake arXiv API.
+
+Run with:
+    uv run python -m pytest .github/scripts/publications
+"""
+
+import asyncio
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from arxiv_client import ArxivClient, ArxivError, FeedParser, RateLimiter  # noqa: E402
+
+HEADER = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+          '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/"'
+          ' xmlns:arxiv="http://arxiv.org/schemas/atom">\n'
+          '<opensearch:totalResults>{total}</opensearch:totalResults>\n')
+ENTRY = ('<entry><id>http://arxiv.org/abs/2101.{n:05d}v1</id><title>Paper {n}</title>'
+         '<author><name>Carlo Ciliberto</name></author><summary>Abstract {n}</summary>'
+         '<arxiv:doi>10.1/{n}</arxiv:doi><arxiv:primary_category term="cs.LG"/></entry>\n')
+
+
+def feed(numbers, total):
+    return HEADER.format(total=total) + ''.join(ENTRY.format(n=n) for n in numbers) + '</feed>\n'
+
+
+@asynccontextmanager
+async def fake_arxiv(handler):
+    """Serve handler on a free local port and yield the API URL."""
+    app = web.Application()
+    app.router.add_get('/api/query', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f'http://127.0.0.1:{port}/api/query'
+    finally:
+        await runner.cleanup()
+
+
+def client(url, **kwargs):
+    return ArxivClient(base_url=url, rate_limit=0, **kwargs)
+
+
+def test_feed_parser_streams_entries():
+    parser = FeedParser()
+    entries = []
+    for byte in feed([1, 2], total=2).encode('utf-8'):
+        entries.extend(parser.feed(bytes([byte])))
+    entries.extend(parser.close())
+
+    assert parser.total_results == 2
+    assert [e['entry_id'] for e in entries] == ['http://arxiv.org/abs/2101.00001v1', 'http://arxiv.org/abs/2101.00002v1']
+    assert entries[0] == {
+        'entry_id': 'http://arxiv.org/abs/2101.00001v1',
+        'title': 'Paper 1',
+        'authors': ['Carlo Ciliberto'],
+        'summary': 'Abstract 1',
+        'published': '',
+        'updated': '',
+        'doi': '10.1/1',
+        'primary_category': 'cs.LG',
+    }
+
+
+def test_feed_parser_raises_api_errors():
+    body = HEADER.format(total=1) + ('<entry><id>http://arxiv.org/api/errors#bad_query</id>'
+                                     '<title>Error</title><summary>malformed query</summary></entry></feed>')
+    with pytest.raises(ArxivError, match='malformed query'):
+        FeedParser().feed(body.encode('utf-8'))
+
+
+def test_rate_limiter_spaces_requests():
+    async def run():
+        limiter = RateLimiter(0.1)
+        start = time.perf_counter()
+        await asyncio.gather(*(limiter.wait() for _ in range(4)))
+        return time.perf_counter() - start
+
+    assert asyncio.run(run()) >= 0.3
+
+
+def test_paged_feed_follows_total_results():
+    total = 7
+    requests = []
+
+    async def handler(request):
+        start, count = int(request.query['start']), int(request.query['max_results'])
+        requests.append((start, count))
+        if start == 3:
+            # Short page in the middle of the result set
+            count = 1
+        if start == 4 and requests.count((start, count)) == 1:
+            # Empty page glitch, answered properly when retried
+            count = 0
+        return web.Response(text=feed(range(start, min(start + count, total)), total),
+                            content_type='application/atom+xml')
+
+    async def run():
+        async with fake_arxiv(handler) as url, client(url) as c:
+            return [entry['title'] async for entry in c.iter_all('au:"Ciliberto"', page_size=3)]
+
+    assert asyncio.run(run()) == [f'Paper {n}' for n in range(total)]
+    assert requests == [(0, 3), (3, 3), (4, 3), (4, 3)]
+
+
+def test_retries_server_errors():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.query['search_query'])
+        if len(calls) == 1:
+            return web.Response(status=503, text='busy')
+        return web.Response(text=feed([1], 1), content_type='application/atom+xml')
+
+    async def run():
+        async with fake_arxiv(handler) as url, client(url) as c:
+            return await c.search('ti:"Paper 1"')
+
+    results = asyncio.run(run())
+    assert [r['title'] for r in results] == ['Paper 1']
+    assert len(calls) == 2
+
+
+def test_client_errors_are_not_retried():
+    calls = []
+
+    async def handler(request):
+        calls.append(1)
+        return web.Response(status=400, text='bad request')
+
+    async def run():
+        async with fake_arxiv(handler) as url, client(url) as c:
+            return await c.search('ti:"x"')
+
+    with pytest.raises(Exception, match='400'):
+        asyncio.run(run())
+    assert len(calls) == 1
+
+
+def test_truncated_body_keeps_complete_entries():
+    body = feed([1, 2], total=2)
+    truncated = body[:body.index(ENTRY.format(n=2)) + 40]
+
+    async def handler(request):
+        return web.Response(text=truncated, content_type='application/atom+xml')
+
+    entries = []
+
+    async def run():
+        async with fake_arxiv(handler) as url, client(url, chunk_size=64) as c:
+            async for entry in c.iter_query('ti:"x"'):
+                entries.append(entry['title'])
+
+    with pytest.raises(ArxivError, match='incomplete feed'):
+        asyncio.run(run())
+    assert entries == ['Paper 1']
@@ -0,0 +1,139 @@
+"""
+Tests for check_links.py against a local fake web server.
+
+Run with:
+    uv run python -m pytest .github/scripts/publications
+"""
+
+import asyncio
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import check_links  # noqa: E402
+
+ETAG = '"v1"'
+LAST_MODIFIED = 'Wed, 01 Jan 2025 00:00:00 GMT'
+
+
+class FakeSite(BaseHTTPRequestHandler):
+    """
+    /etag and /modified answer conditional requests with 304, /no-head
+    rejects HEAD but serves ranged GETs, anything else is 404.
+    """
+
+    requests = []
+
+    def do_HEAD(self):
+        self.respond()
+
+    def do_GET(self):
+        self.respond()
+
+    def respond(self):
+        self.requests.append((self.command, self.path, dict(self.headers)))
+        headers = {}
+        if self.path == '/etag':
+            status = 304 if self.headers.get('If-None-Match') == ETAG else 200
+            headers['ETag'] = ETAG
+        elif self.path == '/modified':
+            status = 304 if self.headers.get('If-Modified-Since') == LAST_MODIFIED else 200
+            headers['Last-Modified'] = LAST_MODIFIED
+        elif self.path == '/no-head':
+            if self.command == 'HEAD':
+                status = 405
+            else:
+                status = 206 if self.headers.get('Range') == 'bytes=0-0' else 200
+        else:
+            status = 404
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    FakeSite.requests = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeSite)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def check(site, paths, cache, **kwargs):
+    results = asyncio.run(check_links.check_urls([site + path for path in paths], cache, **kwargs))
+    return {url[len(site):]: result for url, result in results.items()}
+
+
+def requests_to(path):
+    return [(method, headers) for method, p, headers in FakeSite.requests if p == path]
+
+
+def test_validators_round_trip_through_the_cache(site, tmp_path):
+    cache_file = tmp_path / 'link_cache.json'
+
+    cache = check_links.LinkCache(cache_file)
+    first = check(site, ['/etag', '/modified'], cache)
+    cache.save()
+    assert first['/etag']['status'] == 200 and first['/etag']['etag'] == ETAG
+    assert first['/modified']['status'] == 200 and first['/modified']['last_modified'] == LAST_MODIFIED
+    assert 'If-None-Match' not in requests_to('/etag')[0][1]
+
+    # Reloaded from disk, the validators make the second run conditional
+    second = check(site, ['/etag', '/modified'], check_links.LinkCache(cache_file))
+    assert requests_to('/etag')[1][1].get('If-None-Match') == ETAG
+    assert requests_to('/modified')[1][1].get('If-Modified-Since') == LAST_MODIFIED
+
+    # 304 keeps the cached result and only refreshes the check time
+    for path in ('/etag', '/modified'):
+        assert second[path]['status'] == 200
+        assert second[path]['checked'] >= first[path]['checked']
+    assert second['/etag']['etag'] == ETAG
+
+
+def test_head_rejected_falls_back_to_ranged_get(site, tmp_path):
+    results = check(site, ['/no-head'], check_links.LinkCache(tmp_path / 'cache.json'))
+
+    assert check_links.result_is_ok(results['/no-head'])
+    assert results['/no-head']['status'] == 206
+    assert [(method, headers.get('Range')) for method, headers in requests_to('/no-head')] == [
+        ('HEAD', None), ('GET', 'bytes=0-0')]
+
+
+def test_failed_results_are_rechecked_unconditionally(site, tmp_path):
+    cache = check_links.LinkCache(tmp_path / 'cache.json')
+    cache.put(site + '/missing', {'status': 404, 'etag': ETAG, 'last_modified': '', 'error': '', 'checked': 0})
+
+    results = check(site, ['/missing'], cache, max_age=3600)
+
+    assert results['/missing']['status'] == 404
+    assert 'If-None-Match' not in requests_to('/missing')[0][1]
+
+
+def test_recent_successes_are_reused(site, tmp_path):
+    cache = check_links.LinkCache(tmp_path / 'cache.json')
+    check(site, ['/etag'], cache)
+
+    check(site, ['/etag'], cache, max_age=3600)
+
+    assert len(requests_to('/etag')) == 1
+
+
+def test_unreachable_host_reports_error(tmp_path):
+    cache = check_links.LinkCache(tmp_path / 'cache.json')
+    results = asyncio.run(check_links.check_urls(['http://127.0.0.1:9/'], cache, timeout=2))
+
+    assert results['http://127.0.0.1:9/']['status'] is None
+    assert results['http://127.0.0.1:9/']['error']
@@ -0,0 +1,81 @@
+"""
+Tests for the crash-safety helpers in checkpoint.py.
+
+Run with:
+    uv run python -m pytest .github/scripts/publications
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from checkpoint import Journal, atomic_write_text  # noqa: E402
+
+
+def test_replay_drops_torn_last_line(tmp_path):
+    path = tmp_path / 'run.journal'
+    path.write_text('{"index": 1}\n{"index": 2}\n{"index": 3, "url": "http://arx', encoding='utf-8')
+
+    assert Journal.replay(path) == [{'index': 1}, {'index': 2}]
+
+
+def test_resumed_appends_start_on_a_new_line(tmp_path):
+    path = tmp_path / 'run.journal'
+    path.write_text('{"index": 1}\n{"index": 2, "url": "http://arx', encoding='utf-8')
+
+    with Journal(path) as journal:
+        journal.append({'index': 2, 'url': 'http://arxiv.org/abs/1'})
+        journal.append({'index': 3})
+
+    assert path.read_text(encoding='utf-8').count('\n') == 3
+    assert Journal.replay(path) == [{'index': 1}, {'index': 2, 'url': 'http://arxiv.org/abs/1'}, {'index': 3}]
+
+
+def test_torn_line_longer_than_a_chunk(tmp_path):
+    path = tmp_path / 'run.journal'
+    path.write_text('{"index": 1}\n{"abstract": "' + 'x' * 10000, encoding='utf-8')
+
+    with Journal(path) as journal:
+        journal.append({'index': 2})
+
+    assert Journal.replay(path) == [{'index': 1}, {'index': 2}]
+
+
+def test_only_torn_line(tmp_path):
+    path = tmp_path / 'run.journal'
+    path.write_text('{"ind', encoding='utf-8')
+
+    with Journal(path) as journal:
+        journal.append({'index': 1})
+
+    assert Journal.replay(path) == [{'index': 1}]
+
+
+def test_invalid_lines_are_skipped(tmp_path):
+    path = tmp_path / 'run.journal'
+    path.write_text('{"index": 1}\nnot json\n{"index": 2}\n', encoding='utf-8')
+
+    assert Journal.replay(path) == [{'index': 1}, {'index': 2}]
+
+
+def test_remove_and_missing_journal(tmp_path):
+    path = tmp_path / 'run.journal'
+    assert Journal.replay(path) == []
+    with Journal(path) as journal:
+        journal.append({'index': 1})
+    journal.remove()
+    assert not path.exists()
+
+
+def test_atomic_write_keeps_mode(tmp_path):
+    path = tmp_path / 'publications.yml'
+    path.write_text('old', encoding='utf-8')
+    os.chmod(path, 0o644)
+
+    atomic_write_text(path, 'new')
+
+    assert path.read_text(encoding='utf-8') == 'new'
+    assert path.stat().st_mode & 0o777 == 0o644
+    assert [p.name for p in tmp_path.iterdir()] == ['publications.yml']
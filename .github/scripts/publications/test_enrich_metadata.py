@@ -0,0 +1,81 @@
+"""
+Tests for the parallel source lookups of enrich_metadata.py.
+
+Run with:
+    uv run python -m pytest .github/scripts/publications
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import enrich_metadata  # noqa: E402
+
+TITLE = 'Learning to Learn Around a Common Mean'
+
+
+class FakeSource(enrich_metadata.Source):
+    """Source answering after a delay with a fixed candidate, or raising an error."""
+
+    def __init__(self, name, delay=0.0, candidate=None, error=None, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+        self.delay = delay
+        self.candidate = candidate
+        self.error = error
+        self.cancelled = False
+
+    async def search(self, title):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return [self.candidate] if self.candidate else []
+
+
+def find(sources, wanted=('url', 'doi')):
+    async def run():
+        for source in sources:
+            await source.open(None)
+        return await enrich_metadata.find_first_match(TITLE, sources, 0.8, wanted)
+
+    return asyncio.run(run())
+
+
+def test_first_match_cancels_slower_sources():
+    fast = FakeSource('fast', 0.01, {'title': TITLE, 'url': 'https://arxiv.org/abs/1', 'doi': ''})
+    slow = FakeSource('slow', 5.0, {'title': TITLE, 'url': 'https://slow', 'doi': '10.1/slow'})
+
+    match = find([slow, fast])
+
+    assert match['source'] == 'fast'
+    assert match['url'] == 'https://arxiv.org/abs/1'
+    assert slow.cancelled
+
+
+def test_match_must_supply_a_missing_field():
+    url_only = FakeSource('url_only', 0.0, {'title': TITLE, 'url': 'https://arxiv.org/abs/1', 'doi': ''})
+    with_doi = FakeSource('with_doi', 0.05, {'title': TITLE, 'url': '', 'doi': '10.1/x'})
+
+    assert find([url_only, with_doi], wanted=('doi',))['source'] == 'with_doi'
+
+
+def test_failures_and_timeouts_give_no_match(capsys):
+    broken = FakeSource('broken', error=RuntimeError('boom'))
+    slow = FakeSource('slow', delay=5.0, timeout=0.05)
+    unrelated = FakeSource('unrelated', candidate={'title': 'Something Else', 'url': 'https://x', 'doi': ''})
+
+    assert find([broken, slow, unrelated]) is None
+    out = capsys.readouterr().out
+    assert 'broken failed' in out and 'boom' in out
+    assert 'slow failed' in out and 'TimeoutError' in out
+
+
+def test_arxiv_source_close_without_open():
+    source = enrich_metadata.ArxivSource()
+    asyncio.run(source.close())
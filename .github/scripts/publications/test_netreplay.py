@@ -0,0 +1,120 @@
+"""
+Tests for netreplay.py: recording through the stand-in, replaying a
+session cut short by a killed recorder, and deterministic error injection.
+
+Run with:
+    uv run python -m pytest .github/scripts/publications
+"""
+
+import asyncio
+import gzip
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import netreplay  # noqa: E402
+
+
+def write_record(f, key, body):
+    f.write(json.dumps({'key': key, 'status': 200, 'headers': {}, 'elapsed': 0.0, 'body': body}) + '\n')
+    f.flush()
+
+
+def test_load_archive_of_killed_recorder(tmp_path):
+    path = tmp_path / 'session.jsonl.gz'
+    f = gzip.open(path, 'wt', encoding='utf-8')
+    write_record(f, 'GET /arxiv?q=1', 'one')
+    write_record(f, 'GET /arxiv?q=2', 'two')
+    f.write('{"key": "GET /arxiv?q=3", "sta')
+    f.flush()
+    # Copy before close(): no gzip trailer, as if the recorder was killed
+    killed = tmp_path / 'killed.jsonl.gz'
+    shutil.copyfile(path, killed)
+    f.close()
+
+    exchanges = netreplay.load_archive(killed)
+    assert sorted(exchanges) == ['GET /arxiv?q=1', 'GET /arxiv?q=2']
+    assert exchanges['GET /arxiv?q=2'][0]['body'] == 'two'
+
+
+def test_parse_routes():
+    routes = netreplay.parse_routes(['arxiv=http://127.0.0.1:8000/api/query/', 'geo=http://localhost/search'])
+    assert routes['arxiv'] == 'http://127.0.0.1:8000/api/query'
+    assert routes['geo'] == 'http://localhost/search'
+    assert routes['crossref'] == netreplay.ROUTES['crossref']
+
+
+async def start(stand_in):
+    await stand_in.start('127.0.0.1', 0)
+    return f'http://127.0.0.1:{stand_in._runner.addresses[0][1]}'
+
+
+async def fetch(session, url):
+    async with session.get(url) as response:
+        return response.status, await response.text()
+
+
+def test_record_then_replay_truncated_session(tmp_path):
+    archive = tmp_path / 'session.jsonl.gz'
+    killed = tmp_path / 'killed.jsonl.gz'
+
+    async def upstream_handler(request):
+        return web.Response(text=f"feed for {request.query['search_query']}")
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/api/query', upstream_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        upstream = f'http://127.0.0.1:{runner.addresses[0][1]}/api/query'
+
+        recorder = netreplay.StandIn('record', archive, netreplay.parse_routes([f'arxiv={upstream}']))
+        base = await start(recorder)
+        async with aiohttp.ClientSession() as session:
+            recorded = [await fetch(session, f'{base}/arxiv?search_query={q}') for q in ('a', 'b')]
+            # The recorder is killed here: the archive has no gzip trailer
+            shutil.copyfile(archive, killed)
+            await recorder.close()
+            await runner.cleanup()
+
+            player = netreplay.StandIn('replay', killed, latency_ms=0)
+            base = await start(player)
+            try:
+                replayed = [await fetch(session, f'{base}/arxiv?search_query={q}') for q in ('a', 'b', 'c')]
+            finally:
+                await player.close()
+        return recorded, replayed, player.stats
+
+    recorded, replayed, stats = asyncio.run(run())
+    assert recorded == [(200, 'feed for a'), (200, 'feed for b')]
+    assert replayed == recorded + [(404, 'not recorded\n')]
+    assert stats['replayed'] == 2 and stats['missing'] == 1
+
+
+def test_error_injection_is_deterministic(tmp_path):
+    archive = tmp_path / 'session.jsonl.gz'
+    with gzip.open(archive, 'wt', encoding='utf-8') as f:
+        for n in range(20):
+            write_record(f, f'GET /arxiv?q={n}', str(n))
+
+    async def statuses(seed, order):
+        player = netreplay.StandIn('replay', archive, latency_ms=0, error_rate=0.5, seed=seed)
+        base = await start(player)
+        try:
+            async with aiohttp.ClientSession() as session:
+                results = await asyncio.gather(*(fetch(session, f'{base}/arxiv?q={n}') for n in order))
+        finally:
+            await player.close()
+        return {n: status for n, (status, _) in zip(order, results)}
+
+    first = asyncio.run(statuses(1, range(20)))
+    assert asyncio.run(statuses(1, list(reversed(range(20))))) == first
+    assert set(first.values()) == {200, 503}
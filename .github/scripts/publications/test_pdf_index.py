@@ -0,0 +1,47 @@
+"""
+Tests for the title-based linking of pdf_index.py.
+
+Run with:
+    uv run python -m pytest .github/scripts/publications
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import pdf_index  # noqa: E402
+
+ENTRIES = [
+    {'ID': 'a', 'ENTRYTYPE': 'inproceedings', 'title': '{Learning to Learn} Around a Common Mean'},
+    {'ID': 'b', 'ENTRYTYPE': 'article', 'title': 'A General Framework for Consistent Structured Prediction',
+     'local_paper': 'papers/structured.pdf'},
+]
+
+
+def test_material_for():
+    assert pdf_index.material_for('paper1.pdf') == 'paper'
+    assert pdf_index.material_for('papers/x.pdf') == 'paper'
+    assert pdf_index.material_for('slides/talk.pdf') == 'slides'
+    assert pdf_index.material_for('carlo_ciliberto_cv.pdf') is None
+
+
+def test_links_by_title():
+    index = {
+        'slides1.pdf': {'title': 'Learning to learn around a common mean'},
+        'paper2.pdf': {'title': 'A general framework for consistent structured prediction'},
+        'paper3.pdf': {'title': 'Something else entirely'},
+    }
+    links = pdf_index.find_links(index, ENTRIES)
+    # paper2.pdf matches b, which already has a local paper
+    assert [(entry['ID'], field, name) for entry, field, name, _ in links] == [('a', 'local_slides', 'slides1.pdf')]
+
+
+def test_one_pdf_per_entry_and_field():
+    index = {
+        'paper1.pdf': {'title': 'Learning to Learn Around a Common Mean (extended)'},
+        'papers/l2l.pdf': {'title': 'Learning to Learn Around a Common Mean'},
+    }
+    links = pdf_index.find_links(index, ENTRIES)
+    assert [(entry['ID'], field, name) for entry, field, name, _ in links] == [('a', 'local_paper', 'papers/l2l.pdf')]
+    assert links[0][3] == 1.0
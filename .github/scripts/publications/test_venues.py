@@ -0,0 +1,49 @@
+"""
+Tests for venues.py against the venue table in .github/data/venues.yml.
+
+Run with:
+    uv run python -m pytest .github/scripts/publications
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from venues import VenueTable  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def table():
+    return VenueTable.load()
+
+
+@pytest.mark.parametrize('venue, expected', [
+    ('Advances in Neural Information Processing Systems 33',
+     ('inproceedings', 'Advances in Neural Information Processing Systems')),
+    ('Proceedings of CVPR', ('inproceedings', 'IEEE Conference on Computer Vision and Pattern Recognition')),
+    ('Journal of Machine Learning Research 21', ('article', 'Journal of Machine Learning Research')),
+    ('arXiv preprint arXiv:2001.00001', ('misc', 'arXiv')),
+    ('', ('misc', 'Preprint')),
+    ('Some Unknown Venue', ('inproceedings', 'Some Unknown Venue')),
+])
+def test_known_venues_and_keywords(table, venue, expected):
+    assert table.classify(venue) == expected
+
+
+@pytest.mark.parametrize('venue', [
+    'NeurIPS 2020 Workshop on Meta-Learning',
+    '4th Workshop on Meta-Learning at NeurIPS 2020',
+    'ICML 2019 Workshop on Adaptive and Multitask Learning',
+    'ICLR 2021 Workshop on Geometrical and Topological Representation Learning',
+])
+def test_workshops_keep_their_own_name(table, venue):
+    assert table.classify(venue) == ('inproceedings', venue)
+
+
+@pytest.mark.parametrize('venue', ['CVPR workshops', 'IEEE/CVF CVPR Workshops (CVPRW)'])
+def test_workshop_venues_are_still_recognised(table, venue):
+    assert table.classify(venue) == (
+        'inproceedings', 'IEEE Conference on Computer Vision and Pattern Recognition Workshops')
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Classify venue strings and map them to canonical venue names.
+
+The venue table (.github/data/venues.yml) lists known venues with their
+BibTeX entry type and aliases, plus generic keywords ("journal",
+"conference", "arxiv", ...) used when no known venue matches. All aliases
+are compiled into a single trie-shaped regular expression, so a venue
+string is classified in one scan whose cost does not grow with the number
+of aliases in the table.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError:
+    print("Error: PyYAML library not found!")
+    print("Install it with: uv pip install pyyaml")
+    sys.exit(1)
+
+# Resolved from this file so the table loads whatever the working directory
+VENUES_FILE = Path(__file__).resolve().parents[2] / 'data' / 'venues.yml'
+
+DEFAULT_TYPE = 'inproceedings'
+
+# Venue strings naming a workshop are never given a main-conference name
+WORKSHOP_PATTERN = re.compile(r'\bworkshops?\b')
+
+
+def normalize_venue(text):
+    """Lowercase and replace punctuation with single spaces ("IEEE/RSJ" -> "ieee rsj")."""
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', text.lower()).split())
+
+
+def trie_pattern(words):
+    """
+    Build a regular expression matching any of the given words.
+
+    The words are merged into a character trie, so the expression shares
+    common prefixes ("conference on|conference of" -> "conference o(?:n|f)")
+    and the regex engine never tries more than one branch per character.
+    Longer words are preferred over their prefixes.
+
+    Returns:
+        Pattern string (without anchors or word boundaries)
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # A word ends here, but continuing to a longer word is tried first
+            return '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+class VenueTable:
+    """
+    Compiled venue table.
+
+    Each alias maps to a rule dictionary with 'type', 'name' (canonical
+    venue name, or None to keep the original string), 'rank' (0 for
+    known venues, 1+ for keywords in priority order) and 'workshop'
+    (True for venues that are themselves workshops).
+    """
+
+    def __init__(self, venues, keywords):
+        """
+        Args:
+            venues: List of {'name', 'type', 'aliases', optional 'workshop'} dictionaries
+            keywords: List of {'type', 'aliases', optional 'name'} dictionaries
+        """
+        self.rules = {}
+        for venue in venues:
+            rule = {'type': venue['type'], 'name': venue['name'], 'rank': 0,
+                    'workshop': bool(venue.get('workshop'))}
+            for alias in venue['aliases']:
+                self.rules[normalize_venue(str(alias))] = rule
+        for rank, keyword in enumerate(keywords, 1):
+            rule = {'type': keyword['type'], 'name': keyword.get('name'), 'rank': rank, 'workshop': False}
+            for alias in keyword['aliases']:
+                # Known venues take precedence over keywords with the same alias
+                self.rules.setdefault(normalize_venue(str(alias)), rule)
+
+        self.pattern = re.compile(r'\b' + trie_pattern(self.rules) + r'\b')
+
+    @classmethod
+    def load(cls, path=VENUES_FILE):
+        """Load the venue table from a YAML file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+        return cls(data.get('venues', []), data.get('keywords', []))
+
+    def match(self, venue):
+        """
+        Find the best matching rule for a venue string.
+
+        Known venues beat keywords; among known venues the longest alias
+        wins, among keywords the one listed first. A venue string naming a
+        workshop ("NeurIPS 2020 Workshop on ...") only matches known venues
+        marked as workshops, so it is never relabelled as the conference.
+
+        Returns:
+            Rule dictionary, or None if nothing matches
+        """
+        text = normalize_venue(venue)
+        is_workshop = WORKSHOP_PATTERN.search(text) is not None
+        best, best_key = None, None
+        for m in self.pattern.finditer(text):
+            rule = self.rules[m.group(0)]
+            if is_workshop and rule['rank'] == 0 and not rule['workshop']:
+                continue
+            key = (rule['rank'], -len(m.group(0)))
+            if best_key is None or key < best_key:
+                best, best_key = rule, key
+        return best
+
+    def classify(self, venue):
+        """
+        Decide the BibTeX entry type and canonical name of a venue.
+
+        Returns:
+            Tuple (entry type, venue name); unknown venues keep their name
+            and default to inproceedings, empty venues are preprints
+        """
+        if not venue or not venue.strip():
+            return 'misc', 'Preprint'
+        rule = self.match(venue)
+        if rule is None:
+            return DEFAULT_TYPE, venue
+        return rule['type'], rule['name'] or venue
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Watch the BibTeX file and regenerate the Jekyll data files on every save.
+
+The parsed bibliography stays in memory: on each change only the entries
+whose source text changed are re-parsed, and the data files are rewritten
+only when their content actually changes (so no-op saves do not trigger a
+Jekyll rebuild). Uses inotify on Linux and falls back to polling elsewhere.
+
+Usage:
+    uv run python .github/scripts/publications/watch_bibtex.py
+"""
+
+import ctypes
+import ctypes.util
+import os
+import re
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from author_registry import AuthorRegistry
+from bibtex_to_data import (
+    AUTHORS_FILE, BIBTEX_FILE, DETAILS_DIR, OUTPUT_FILE,
+    build_publications, dump_yaml, parse_bibtex_string, write_details, write_if_changed,
+)
+
+# Every entry starts with "@" at the beginning of a line
+ENTRY_START = re.compile(r'^(?=@)', re.MULTILINE)
+
+# @string definitions affect every entry, so changing one forces a full re-parse
+STRING_DEF = re.compile(r'^@string\s*[{(]', re.IGNORECASE)
+
+# "@type{key," header of a regular entry
+ENTRY_HEADER = re.compile(r'^@\s*(\w+)\s*[{(]\s*([^,\s]+)\s*,')
+NON_ENTRIES = {'string', 'comment', 'preamble'}
+
+# inotify event masks (from <sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+INOTIFY_EVENT = struct.Struct('iIII')
+
+
+def split_chunks(text):
+    """Split BibTeX source into chunks, one per "@..." block (plus any leading text)."""
+    return [chunk for chunk in ENTRY_START.split(text) if chunk.strip()]
+
+
+class BibliographyCache:
+    """
+    Parsed bibliography kept in memory between regenerations.
+
+    Entries are cached by the exact source text of their chunk, so an edit
+    re-parses only the chunks that differ from the previous version.
+    """
+
+    def __init__(self):
+        self._chunks = {}
+        self._strings = ()
+
+    def update(self, text):
+        """
+        Bring the cache in line with new source text.
+
+        Returns:
+            Tuple (entries in file order, number of chunks re-parsed)
+        """
+        chunks = split_chunks(text)
+
+        strings = tuple(c for c in chunks if STRING_DEF.match(c))
+        if strings != self._strings:
+            self._chunks = {}
+            self._strings = strings
+
+        changed = [c for c in chunks if c not in self._chunks]
+        if changed:
+            # Re-parse only the changed chunks, in one parser call
+            # (with the macros prepended so references resolve)
+            parsed = {}
+            for entry in parse_bibtex_string(''.join(strings) + ''.join(changed)):
+                parsed.setdefault(entry.get('ID'), []).append(entry)
+
+            for chunk in changed:
+                match = ENTRY_HEADER.match(chunk)
+                key = match.group(2) if match and match.group(1).lower() not in NON_ENTRIES else None
+                same_key = parsed.get(key)
+                self._chunks[chunk] = [same_key.pop(0)] if same_key else []
+
+        # Forget chunks that no longer exist
+        current = set(chunks)
+        for chunk in list(self._chunks):
+            if chunk not in current:
+                del self._chunks[chunk]
+
+        entries = [entry for chunk in chunks for entry in self._chunks[chunk]]
+        return entries, len(changed)
+
+
+def regenerate(cache, bibtex_file, output_file, authors_file, details_dir=DETAILS_DIR):
+    """
+    Re-read the BibTeX file and rewrite the data files if their content changed.
+
+    Returns:
+        Tuple (number of re-parsed chunks, list of written files)
+    """
+    text = Path(bibtex_file).read_text(encoding='utf-8')
+    entries, reparsed = cache.update(text)
+
+    registry = AuthorRegistry()
+    publications = build_publications(entries, registry)
+
+    written = []
+    if write_if_changed(output_file, dump_yaml(publications)):
+        written.append(output_file)
+    if write_if_changed(authors_file, dump_yaml(registry.export())):
+        written.append(authors_file)
+    if any(write_details(entries, details_dir)):
+        written.append(details_dir)
+    return reparsed, written
+
+
+class Inotify:
+    """Minimal inotify wrapper (Linux only) built on libc through ctypes."""
+
+    def __init__(self, directory, mask=IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+        if wd < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+
+    def read(self, timeout=None):
+        """
+        Wait for events and return the names of the files they concern.
+
+        Returns:
+            Set of file names (empty on timeout)
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        data = os.read(self.fd, 64 * 1024)
+        names = set()
+        offset = 0
+        while offset < len(data):
+            _, _, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            offset += INOTIFY_EVENT.size
+            names.add(os.fsdecode(data[offset:offset + length].rstrip(b'\0')))
+            offset += length
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+def wait_inotify(watcher, bibtex_file, debounce):
+    """Block until bibtex_file is written, then let the burst of editor events settle."""
+    while bibtex_file.name not in watcher.read():
+        pass
+    while watcher.read(timeout=debounce):
+        pass
+
+
+def wait_polling(bibtex_file, interval, last_state):
+    """
+    Block until bibtex_file's mtime or size changes.
+
+    Returns:
+        New (mtime_ns, size) state
+    """
+    while True:
+        time.sleep(interval)
+        try:
+            stat = bibtex_file.stat()
+        except FileNotFoundError:
+            continue
+        state = (stat.st_mtime_ns, stat.st_size)
+        if state != last_state:
+            return state
+
+
+def file_state(path):
+    """Return (mtime_ns, size) of path, or None if missing."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def watch(bibtex_file=BIBTEX_FILE, output_file=OUTPUT_FILE, authors_file=AUTHORS_FILE,
+          details_dir=DETAILS_DIR, interval=1.0, debounce=0.1, use_inotify=True):
+    """
+    Regenerate the data files whenever the BibTeX file changes, until Ctrl-C.
+
+    Args:
+        bibtex_file: Path to the BibTeX source
+        output_file: Path of the publications YAML data file
+        authors_file: Path of the author index YAML data file
+        details_dir: Directory of the per-entry JSON detail files
+        interval: Polling interval in seconds (polling fallback only)
+        debounce: Seconds of quiet to wait for after an inotify event
+        use_inotify: Set to False to force polling
+    """
+    bibtex_file = Path(bibtex_file)
+    output_file = Path(output_file)
+    authors_file = Path(authors_file)
+
+    if not bibtex_file.exists():
+        print(f"Error: {bibtex_file} not found!")
+        return False
+
+    watcher = None
+    if use_inotify and sys.platform.startswith('linux'):
+        try:
+            # Watch the directory: many editors save by renaming a new file over the old one
+            watcher = Inotify(bibtex_file.parent)
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable ({e}), falling back to polling")
+
+    cache = BibliographyCache()
+    state = file_state(bibtex_file)
+
+    print(f"Watching {bibtex_file} ({'inotify' if watcher else f'polling every {interval}s'})")
+    print("Press Ctrl-C to stop.")
+    print()
+
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                reparsed, written = regenerate(cache, bibtex_file, output_file, authors_file, details_dir)
+            except FileNotFoundError:
+                print(f"  {bibtex_file} disappeared, waiting for it to come back")
+            else:
+                elapsed = (time.perf_counter() - start) * 1000
+                stamp = time.strftime('%H:%M:%S')
+                if written:
+                    names = ', '.join(str(p) for p in written)
+                    print(f"[{stamp}] re-parsed {reparsed} entries, wrote {names} ({elapsed:.0f} ms)")
+                else:
+                    print(f"[{stamp}] re-parsed {reparsed} entries, no changes ({elapsed:.0f} ms)")
+
+            if watcher:
+                wait_inotify(watcher, bibtex_file, debounce)
+            else:
+                state = wait_polling(bibtex_file, interval, state)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        if watcher:
+            watcher.close()
+    return True
+
+
+def main():
+    """Main function."""
+    watch()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Post-build optimizer for the generated site (_site/).
+
+Minifies HTML, CSS and JS and writes precompressed .gz and .br siblings,
+processing files in parallel. A hash manifest (kept outside _site/, which
+Jekyll wipes on every build) records what was produced for each input, so
+unchanged files are skipped or restored from the cache on later builds.
+
+The minifiers (minify-html, rcssmin, rjsmin) are required unless
+--no-minify is passed; brotli is optional, without it only .gz siblings
+are written.
+
+Usage:
+    bundle exec jekyll build
+    uv run python .github/scripts/site/optimize_site.py
+    uv run python .github/scripts/site/optimize_site.py --no-minify   # precompress only
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import minify_html
+except ImportError:
+    minify_html = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SITE_DIR = Path('_site')
+CACHE_DIR = Path('.jekyll-cache/site-optimizer')
+
+# File types that are worth precompressing
+COMPRESSIBLE = {'.html', '.css', '.js', '.json', '.xml', '.svg', '.txt', '.map', '.pdf', '.ico'}
+
+# Only keep a compressed sibling if it saves at least this fraction
+MIN_SAVING = 0.1
+
+# Bump when minification or compression settings change
+OPTIMIZER_VERSION = 1
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def minify(data, suffix):
+    """
+    Minify HTML/CSS/JS content.
+
+    Returns:
+        Minified bytes (unchanged input if no minifier is available or it fails)
+    """
+    try:
+        if suffix == '.html' and minify_html:
+            text = minify_html.minify(data.decode('utf-8'), minify_css=True, minify_js=True,
+                                      keep_closing_tags=True, keep_html_and_head_opening_tags=True)
+            return text.encode('utf-8')
+        if suffix == '.css' and rcssmin:
+            return rcssmin.cssmin(data.decode('utf-8')).encode('utf-8')
+        if suffix == '.js' and rjsmin:
+            return rjsmin.jsmin(data.decode('utf-8')).encode('utf-8')
+    except (UnicodeDecodeError, ValueError):
+        pass
+    return data
+
+
+def compress(data):
+    """
+    Build precompressed variants of data.
+
+    Returns:
+        Dictionary suffix ('.gz', '.br') -> bytes, only for worthwhile savings
+    """
+    variants = {'.gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli:
+        variants['.br'] = brotli.compress(data, quality=11)
+    limit = len(data) * (1 - MIN_SAVING)
+    return {suffix: blob for suffix, blob in variants.items() if len(blob) <= limit}
+
+
+def optimize_file(job):
+    """
+    Minify and compress one file in place (runs in a worker process).
+
+    Args:
+        job: Tuple (path, relative name, cache objects directory, minify flag)
+
+    Returns:
+        Tuple (relative name, manifest record, size before, size after minification)
+    """
+    path, rel, objects_dir, minify_enabled = job
+    path = Path(path)
+    objects_dir = Path(objects_dir)
+
+    data = path.read_bytes()
+    source_hash = sha256(data)
+    if minify_enabled and not rel.endswith('.min.js'):
+        output = minify(data, path.suffix.lower())
+    else:
+        output = data
+    output_hash = sha256(output)
+
+    if output != data:
+        path.write_bytes(output)
+
+    variants = compress(output)
+    for suffix, blob in variants.items():
+        Path(str(path) + suffix).write_bytes(blob)
+
+    # Keep copies so identical inputs on later builds are restored, not recomputed
+    shutil.copyfile(path, objects_dir / output_hash)
+    for suffix in variants:
+        shutil.copyfile(str(path) + suffix, objects_dir / (output_hash + suffix))
+
+    record = {'source': source_hash, 'output': output_hash, 'variants': sorted(variants)}
+    return rel, record, len(data), len(output)
+
+
+def restore_file(path, record, objects_dir):
+    """
+    Restore a previously optimized file and its siblings from the cache.
+
+    Returns:
+        True if every cached object was available
+    """
+    output_hash = record['output']
+    names = [output_hash] + [output_hash + suffix for suffix in record['variants']]
+    if not all((objects_dir / name).exists() for name in names):
+        return False
+    shutil.copyfile(objects_dir / output_hash, path)
+    for suffix in record['variants']:
+        shutil.copyfile(objects_dir / (output_hash + suffix), str(path) + suffix)
+    return True
+
+
+def siblings_exist(path, record):
+    return all(Path(str(path) + suffix).exists() for suffix in record['variants'])
+
+
+def load_manifest(path, minify_enabled=True):
+    """
+    Load the manifest.
+
+    Returns {} if it is missing or corrupt, or was written by another
+    optimizer version or with a different minification setting.
+    """
+    try:
+        manifest = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if manifest.get('version') != OPTIMIZER_VERSION or manifest.get('minify', True) != minify_enabled:
+        return {}
+    return manifest.get('files', {})
+
+
+def optimize_site(site_dir=SITE_DIR, cache_dir=CACHE_DIR, workers=None, minify_enabled=True):
+    """
+    Optimize all compressible files under site_dir.
+
+    Args:
+        site_dir: Jekyll output directory
+        cache_dir: Directory for the manifest and cached outputs
+        workers: Number of worker processes (default: CPU count)
+        minify_enabled: Minify HTML/CSS/JS (requires all three minifiers)
+
+    Returns:
+        True on success, False if site_dir does not exist or a minifier is missing
+    """
+    site_dir = Path(site_dir)
+    cache_dir = Path(cache_dir)
+    objects_dir = cache_dir / 'objects'
+    manifest_file = cache_dir / 'manifest.json'
+
+    if not site_dir.is_dir():
+        print(f"Error: {site_dir} not found! Run 'bundle exec jekyll build' first.")
+        return False
+
+    missing = [name for name, module in [('minify-html', minify_html), ('rcssmin', rcssmin),
+                                         ('rjsmin', rjsmin)] if module is None]
+    if minify_enabled and missing:
+        print(f"Error: {', '.join(missing)} library not found!")
+        print(f"Install it with: uv pip install {' '.join(missing)}")
+        print("(or pass --no-minify to only precompress)")
+        return False
+    if brotli is None:
+        print("Note: brotli not installed; only .gz siblings are written")
+        print("      Install with: uv pip install brotli")
+
+    objects_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(manifest_file, minify_enabled)
+
+    stats = {'processed': 0, 'skipped': 0, 'restored': 0}
+    new_manifest = {}
+    jobs = []
+
+    for path in sorted(site_dir.rglob('*')):
+        if not path.is_file() or path.suffix.lower() not in COMPRESSIBLE:
+            continue
+        rel = path.relative_to(site_dir).as_posix()
+        record = manifest.get(rel)
+        if record:
+            current = sha256(path.read_bytes())
+            if current == record['output'] and siblings_exist(path, record):
+                # Already optimized (e.g. an incremental build left it untouched)
+                new_manifest[rel] = record
+                stats['skipped'] += 1
+                continue
+            if current == record['source'] and restore_file(path, record, objects_dir):
+                # Same input as last build: reuse the cached outputs
+                new_manifest[rel] = record
+                stats['restored'] += 1
+                continue
+        jobs.append((str(path), rel, str(objects_dir), minify_enabled))
+
+    before_total = after_total = 0
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            for rel, record, before, after in pool.map(optimize_file, jobs, chunksize=16):
+                new_manifest[rel] = record
+                before_total += before
+                after_total += after
+                stats['processed'] += 1
+
+    # Drop cached objects no longer referenced
+    referenced = set()
+    for record in new_manifest.values():
+        referenced.add(record['output'])
+        referenced.update(record['output'] + suffix for suffix in record['variants'])
+    for path in objects_dir.iterdir():
+        if path.name not in referenced:
+            path.unlink()
+
+    manifest_file.write_text(
+        json.dumps({'version': OPTIMIZER_VERSION, 'minify': minify_enabled, 'files': new_manifest},
+                   indent=1, sort_keys=True),
+        encoding='utf-8',
+    )
+
+    print(f"Optimized {stats['processed']} files, restored {stats['restored']} from cache, "
+          f"skipped {stats['skipped']} unchanged")
+    if minify_enabled and before_total:
+        print(f"Minified {before_total / 1024:.0f} KiB to {after_total / 1024:.0f} KiB")
+    return True
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Minify and precompress the generated site.")
+    parser.add_argument('--site-dir', default=SITE_DIR, help="Jekyll output directory (default: %(default)s)")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="manifest and cache (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--no-minify', action='store_true',
+                        help="skip minification (the minifier libraries are then not required)")
+    args = parser.parse_args()
+
+    ok = optimize_site(args.site_dir, args.cache_dir, args.workers, not args.no_minify)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
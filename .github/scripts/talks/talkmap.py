@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Generate the talk map data from the front matter of _talks/*.md.
+
+Each talk's `location` is geocoded once and stored in an on-disk cache, so
+later runs only look up locations that have not been seen before. The
+remaining lookups are deduplicated and issued one after another under the
+geocoder's rate limit (Nominatim allows one request per second). The
+result is written to _data/talk_locations.yml, which _pages/talkmap.html
+renders with Leaflet.
+
+Usage:
+    uv run python .github/scripts/talks/talkmap.py
+"""
+
+import argparse
+import json
+import sys
+import time
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+try:
+    import yaml
+except ImportError:
+    print("Error: PyYAML library not found!")
+    print("Install it with: uv pip install pyyaml")
+    sys.exit(1)
+
+TALKS_DIR = Path('_talks')
+DATA_FILE = Path('_data/talk_locations.yml')
+CACHE_FILE = Path('.github/data/geocode_cache.json')
+
+GEOCODER_URL = 'https://nominatim.openstreetmap.org/search'
+
+# Nominatim usage policy: at most one request per second
+GEOCODER_RATE_LIMIT = 1.0
+
+USER_AGENT = 'cciliber.github.io talk map generator'
+
+
+def read_front_matter(path):
+    """
+    Parse the YAML front matter of a Markdown file.
+
+    Returns:
+        Dictionary of front matter fields ({} if the file has none)
+    """
+    text = Path(path).read_text(encoding='utf-8')
+    if not text.startswith('---'):
+        return {}
+    parts = text.split('\n---', 1)
+    if len(parts) < 2:
+        return {}
+    try:
+        data = yaml.safe_load(parts[0][3:])
+    except yaml.YAMLError as e:
+        print(f"  ⚠️  Skipping {path}: invalid front matter ({e})")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def normalize_location(location):
+    """Cache key for a location: whitespace-collapsed and case-folded."""
+    return ' '.join(str(location).split()).casefold()
+
+
+def read_talks(talks_dir=TALKS_DIR):
+    """
+    Read all talks that have a location.
+
+    Returns:
+        List of dictionaries with title, date, venue, location and url
+    """
+    talks = []
+    for path in sorted(Path(talks_dir).glob('*.md')):
+        meta = read_front_matter(path)
+        location = str(meta.get('location') or '').strip()
+        if not location:
+            continue
+        talks.append({
+            'title': str(meta.get('title', path.stem)),
+            'date': str(meta.get('date', '')),
+            'venue': str(meta.get('venue', '')),
+            'location': location,
+            # Matches the talks collection permalink /:collection/:path/
+            'url': meta.get('permalink') or f'/talks/{path.stem}/',
+        })
+    return talks
+
+
+class GeocodeCache:
+    """
+    On-disk cache of geocoding results.
+
+    Maps each normalized location to {'lat', 'lon'}, or to None when the
+    geocoder found nothing (so unknown places are not looked up again).
+    """
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = Path(path)
+        self.results = {}
+        self.changed = False
+        if self.path.exists():
+            try:
+                self.results = json.loads(self.path.read_text(encoding='utf-8'))
+            except json.JSONDecodeError:
+                print(f"⚠️  Ignoring corrupt geocode cache {self.path}")
+
+    def __contains__(self, location):
+        return normalize_location(location) in self.results
+
+    def get(self, location):
+        return self.results.get(normalize_location(location))
+
+    def put(self, location, result):
+        self.results[normalize_location(location)] = result
+        self.changed = True
+
+    def save(self):
+        if not self.changed and self.path.exists():
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.results, indent=1, sort_keys=True, ensure_ascii=False) + '\n',
+                             encoding='utf-8')
+
+
+class Geocoder:
+    """
+    Minimal Nominatim-style geocoder client with a request rate limit.
+
+    Any endpoint answering `?q=<place>&format=json&limit=1` with a JSON list
+    of {"lat", "lon"} objects works, e.g. a local stand-in server.
+    """
+
+    def __init__(self, base_url=GEOCODER_URL, rate_limit=GEOCODER_RATE_LIMIT, timeout=10.0):
+        """
+        Args:
+            base_url: Search endpoint
+            rate_limit: Minimum seconds between requests
+            timeout: Per-request timeout in seconds
+        """
+        self.base_url = base_url
+        self.rate_limit = rate_limit
+        self.timeout = timeout
+        self._last_request = None
+
+    def _wait(self):
+        if self._last_request is not None:
+            delay = self._last_request + self.rate_limit - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        self._last_request = time.monotonic()
+
+    def geocode(self, location):
+        """
+        Look up one location.
+
+        Returns:
+            {'lat': float, 'lon': float}, or None if the place is unknown
+
+        Raises:
+            OSError, ValueError: On network errors or malformed responses
+        """
+        self._wait()
+        query = urllib.parse.urlencode({'q': location, 'format': 'json', 'limit': '1'})
+        request = urllib.request.Request(f'{self.base_url}?{query}', headers={'User-Agent': USER_AGENT})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            results = json.loads(response.read().decode('utf-8'))
+        if not results:
+            return None
+        return {'lat': round(float(results[0]['lat']), 6), 'lon': round(float(results[0]['lon']), 6)}
+
+
+def geocode_missing(locations, cache, geocoder):
+    """
+    Geocode the locations that are not cached yet.
+
+    Each distinct location is looked up once; failed requests are not
+    cached, so they are retried on the next run.
+
+    Returns:
+        Tuple (number looked up, number of failed requests)
+    """
+    missing = []
+    seen = set()
+    for location in locations:
+        key = normalize_location(location)
+        if key not in seen and location not in cache:
+            seen.add(key)
+            missing.append(location)
+
+    if missing:
+        print(f"Geocoding {len(missing)} new locations "
+              f"(~{len(missing) * geocoder.rate_limit:.0f}s at the rate limit)...")
+
+    failed = 0
+    for location in missing:
+        try:
+            result = geocoder.geocode(location)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"  ✗ {location}: {e}")
+            failed += 1
+            continue
+        cache.put(location, result)
+        if result:
+            print(f"  ✓ {location} ({result['lat']}, {result['lon']})")
+        else:
+            print(f"  ⚠️  {location}: not found")
+    return len(missing), failed
+
+
+def build_map_data(talks, cache):
+    """
+    Group talks by geocoded location.
+
+    Returns:
+        List of dictionaries with name, lat, lon and talks (title, date, venue, url)
+    """
+    places = {}
+    for talk in talks:
+        coords = cache.get(talk['location'])
+        if not coords:
+            continue
+        key = normalize_location(talk['location'])
+        place = places.setdefault(key, {
+            'name': talk['location'],
+            'lat': coords['lat'],
+            'lon': coords['lon'],
+            'talks': [],
+        })
+        place['talks'].append({k: talk[k] for k in ('title', 'date', 'venue', 'url')})
+
+    for place in places.values():
+        place['talks'].sort(key=lambda t: t['date'], reverse=True)
+    return sorted(places.values(), key=lambda p: p['name'].casefold())
+
+
+def generate(talks_dir=TALKS_DIR, data_file=DATA_FILE, cache_file=CACHE_FILE, geocoder_url=GEOCODER_URL,
+             rate_limit=GEOCODER_RATE_LIMIT):
+    """
+    Geocode new talk locations and write the talk map data file.
+
+    Args:
+        talks_dir: Directory of talk Markdown files
+        data_file: YAML data file rendered by _pages/talkmap.html
+        cache_file: JSON geocoding cache
+        geocoder_url: Geocoder search endpoint
+        rate_limit: Minimum seconds between geocoder requests
+
+    Returns:
+        True if every location could be looked up (unknown places included)
+    """
+    data_file = Path(data_file)
+
+    talks = read_talks(talks_dir)
+    print(f"Found {len(talks)} talks with a location in {talks_dir}")
+
+    cache = GeocodeCache(cache_file)
+    geocoder = Geocoder(geocoder_url, rate_limit)
+    looked_up, failed = geocode_missing([talk['location'] for talk in talks], cache, geocoder)
+    cache.save()
+    print(f"Cached: {len({normalize_location(t['location']) for t in talks}) - looked_up}, "
+          f"looked up: {looked_up}, failed: {failed}")
+
+    data = build_map_data(talks, cache)
+    text = yaml.safe_dump(data, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    if not data_file.exists() or data_file.read_text(encoding='utf-8') != text:
+        data_file.parent.mkdir(exist_ok=True)
+        data_file.write_text(text, encoding='utf-8')
+        print(f"✓ Wrote {data_file} ({len(data)} places)")
+    else:
+        print(f"✓ {data_file} already up to date")
+
+    return failed == 0
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Geocode talk locations for the talk map.")
+    parser.add_argument('--talks-dir', default=TALKS_DIR, help="talk Markdown files (default: %(default)s)")
+    parser.add_argument('--data-file', default=DATA_FILE, help="map data file (default: %(default)s)")
+    parser.add_argument('--cache', default=CACHE_FILE, help="geocoding cache (default: %(default)s)")
+    parser.add_argument('--geocoder-url', default=GEOCODER_URL, help="geocoder endpoint (default: %(default)s)")
+    parser.add_argument('--rate-limit', type=float, default=GEOCODER_RATE_LIMIT,
+                        help="seconds between geocoder requests (default: %(default)s)")
+    args = parser.parse_args()
+
+    # Failed lookups are not fatal: the coordinates found so far are cached
+    # and committed by the workflow, and the failures are retried next run
+    ok = generate(args.talks_dir, args.data_file, args.cache, args.geocoder_url, args.rate_limit)
+    if not ok:
+        print("⚠️  Some locations could not be looked up; they will be retried on the next run")
+
+
+if __name__ == "__main__":
+    main()
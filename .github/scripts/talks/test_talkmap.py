@@ -0,0 +1,106 @@
+"""
+Tests for talkmap.py against a local fake geocoder.
+
+Run with:
+    uv run python -m pytest .github/scripts/talks
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import talkmap  # noqa: E402
+
+PLACES = {
+    'London, UK': {'lat': '51.5073219', 'lon': '-0.1276474'},
+    'Genoa, Italy': {'lat': '44.40726', 'lon': '8.9338624'},
+}
+
+
+class FakeGeocoder(BaseHTTPRequestHandler):
+    """Answers ?q=<place> from PLACES; 'Broken' yields a server error."""
+
+    queries = []
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)['q'][0]
+        self.queries.append(query)
+        if query.startswith('Broken'):
+            self.send_error(500)
+            return
+        body = json.dumps([PLACES[query]] if query in PLACES else []).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def geocoder_url():
+    FakeGeocoder.queries = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeGeocoder)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/search'
+    server.shutdown()
+    server.server_close()
+
+
+def write_talk(talks_dir, stem, location, date='2024-01-01'):
+    talks_dir.mkdir(exist_ok=True)
+    (talks_dir / f'{stem}.md').write_text(
+        f"---\ntitle: \"Talk {stem}\"\ndate: {date}\nvenue: \"Venue\"\nlocation: \"{location}\"\n---\n\nAbstract\n",
+        encoding='utf-8')
+
+
+def run(tmp_path, geocoder_url):
+    return talkmap.generate(tmp_path / '_talks', tmp_path / 'talk_locations.yml',
+                            tmp_path / 'geocode_cache.json', geocoder_url, rate_limit=0)
+
+
+def test_locations_are_geocoded_once(tmp_path, geocoder_url):
+    write_talk(tmp_path / '_talks', 'a', 'London, UK', '2023-05-01')
+    write_talk(tmp_path / '_talks', 'b', 'london,  uk', '2024-05-01')
+    write_talk(tmp_path / '_talks', 'c', 'Atlantis')
+
+    assert run(tmp_path, geocoder_url)
+    assert FakeGeocoder.queries == ['London, UK', 'Atlantis']
+
+    places = talkmap.yaml.safe_load((tmp_path / 'talk_locations.yml').read_text(encoding='utf-8'))
+    assert [place['name'] for place in places] == ['London, UK']
+    assert places[0]['lat'] == 51.507322
+    assert [talk['url'] for talk in places[0]['talks']] == ['/talks/b/', '/talks/a/']
+
+    # Everything, including the unknown place, is served from the cache now
+    write_talk(tmp_path / '_talks', 'd', 'Genoa, Italy')
+    assert run(tmp_path, geocoder_url)
+    assert FakeGeocoder.queries == ['London, UK', 'Atlantis', 'Genoa, Italy']
+
+
+def test_failed_lookups_keep_results_and_are_retried(tmp_path, geocoder_url, monkeypatch):
+    write_talk(tmp_path / '_talks', 'a', 'London, UK')
+    write_talk(tmp_path / '_talks', 'b', 'Broken Town')
+
+    monkeypatch.setattr(sys, 'argv', [
+        'talkmap.py', '--talks-dir', str(tmp_path / '_talks'),
+        '--data-file', str(tmp_path / 'talk_locations.yml'),
+        '--cache', str(tmp_path / 'geocode_cache.json'),
+        '--geocoder-url', geocoder_url, '--rate-limit', '0',
+    ])
+    talkmap.main()  # must not exit with an error, so the workflow still commits
+
+    cache = json.loads((tmp_path / 'geocode_cache.json').read_text(encoding='utf-8'))
+    assert cache == {'london, uk': {'lat': 51.507322, 'lon': -0.127647}}
+
+    assert not run(tmp_path, geocoder_url)
+    assert FakeGeocoder.queries == ['London, UK', 'Broken Town', 'Broken Town']